@@ -6,26 +6,71 @@ A standards-compliant MCP server for managing Proxmox VE resources using the low
 
 import os
 import sys
-import json
 import logging
 import asyncio
 from contextlib import asynccontextmanager
-from collections.abc import AsyncIterator
-from dotenv import load_dotenv
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
+# --help output, written in one go
+_HELP_TEXT = """\
+Proxmox MCP Server - Lower-Level MCP SDK
+Usage: python lowlevel_server.py
+
+Environment variables required:
+  PROXMOX_HOST       Proxmox VE host
+  PROXMOX_USER       Proxmox VE username
+  PROXMOX_PASSWORD   Proxmox VE password
+
+Environment variables optional:
+  MCP_PORT          Server port (default: 8001)
+  MCP_HOST          Server host (default: 0.0.0.0)
+"""
+
+# Answer --help before the MCP SDK and service imports below
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] in ["--help", "-h"]:
+    sys.stdout.write(_HELP_TEXT)
+    sys.exit(0)
+
 # MCP imports
 import mcp.types as types
 from mcp.server.lowlevel import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 from mcp.server.sse import SseServerTransport
+from starlette.responses import Response
+
+# Fastest available JSON encoder: orjson, then ujson, then the stdlib
+try:
+    import orjson
+
+    def _dumpb(obj: Any) -> bytes:
+        # Starlette responses want bytes, which orjson produces directly
+        return orjson.dumps(obj)
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        # str, not bytes: the SDK would ship bytes as a base64 blob
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+except ImportError:
+    try:
+        import ujson
+
+        def _json_dumps(obj: Any, **kwargs) -> str:
+            # ujson writes "/" as "\/" unless told otherwise; match the stdlib output
+            return ujson.dumps(obj, escape_forward_slashes=False, **kwargs)
+    except ImportError:
+        import json
+        _json_dumps = json.dumps
 
-# Load environment variables
-load_dotenv()
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        return _json_dumps(obj, indent=2) if indent else _json_dumps(obj)
 
-# Import our service
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-from src.service import ProxmoxService
+    def _dumpb(obj: Any) -> bytes:
+        return _dumps(obj).encode('utf-8')
+
+# Make the repo's src package importable; the service import itself is deferred to server_lifespan
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.cache import AsyncTTLCache, SingleFlight
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -35,6 +80,9 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def server_lifespan(server: Server) -> AsyncIterator[dict]:
     """Manage server startup and shutdown lifecycle."""
+    # Import our service on first use rather than at module import
+    from src.service import ProxmoxService
+    
     # Initialize Proxmox service on startup
     service = ProxmoxService()
     
@@ -43,7 +91,7 @@ async def server_lifespan(server: Server) -> AsyncIterator[dict]:
         await service.test_connection()
         logger.info("✅ Proxmox connection successful")
     except Exception as e:
-        logger.error(f"❌ Proxmox connection failed: {e}")
+        logger.error("❌ Proxmox connection failed: %s", e)
         logger.error("Please check your environment variables:")
         logger.error("  PROXMOX_HOST, PROXMOX_USER, PROXMOX_PASSWORD")
         raise
@@ -57,177 +105,286 @@ async def server_lifespan(server: Server) -> AsyncIterator[dict]:
 # Create server instance
 server = Server("Proxmox MCP Server", lifespan=server_lifespan)
 
+# Tool definitions never change at runtime, so build them once at import.
+# Tools taking the same arguments share one inputSchema dict.
+_NODE_PROPERTY = {
+    "type": "string",
+    "description": "Proxmox node name"
+}
+
+_VMID_NODE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "vmid": {
+            "type": "string",
+            "description": "VM/Container ID"
+        },
+        "node": _NODE_PROPERTY
+    },
+    "required": ["vmid", "node"]
+}
+
+_VM_ID_PROPERTY = {
+    "type": "string",
+    "description": "VM ID"
+}
+
+_SNAPNAME_PROPERTY = {
+    "type": "string",
+    "description": "Snapshot name"
+}
+
+_SNAPSHOTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "vmid": _VM_ID_PROPERTY,
+        "node": _NODE_PROPERTY
+    },
+    "required": ["vmid", "node"]
+}
+
+_SNAPSHOT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "vmid": _VM_ID_PROPERTY,
+        "node": _NODE_PROPERTY,
+        "snapname": _SNAPNAME_PROPERTY
+    },
+    "required": ["vmid", "node", "snapname"]
+}
+
+_CREATE_SNAPSHOT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "vmid": _VM_ID_PROPERTY,
+        "node": _NODE_PROPERTY,
+        "snapname": _SNAPNAME_PROPERTY,
+        "description": {
+            "type": "string",
+            "description": "Snapshot description",
+            "default": ""
+        }
+    },
+    "required": ["vmid", "node", "snapname"]
+}
+
+_TOOLS = [
+    types.Tool(
+        name="list_resources",
+        description="List all VMs and containers in Proxmox cluster",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_resource_status",
+        description="Get detailed status of a specific VM or container",
+        inputSchema=_VMID_NODE_SCHEMA
+    ),
+    types.Tool(
+        name="start_resource",
+        description="Start a VM or container",
+        inputSchema=_VMID_NODE_SCHEMA
+    ),
+    types.Tool(
+        name="stop_resource",
+        description="Stop a VM or container",
+        inputSchema=_VMID_NODE_SCHEMA
+    ),
+    types.Tool(
+        name="shutdown_resource",
+        description="Gracefully shutdown a VM or container",
+        inputSchema=_VMID_NODE_SCHEMA
+    ),
+    types.Tool(
+        name="restart_resource",
+        description="Restart a VM or container",
+        inputSchema=_VMID_NODE_SCHEMA
+    ),
+    types.Tool(
+        name="create_snapshot",
+        description="Create a snapshot of a VM",
+        inputSchema=_CREATE_SNAPSHOT_SCHEMA
+    ),
+    types.Tool(
+        name="delete_snapshot",
+        description="Delete a snapshot of a VM",
+        inputSchema=_SNAPSHOT_SCHEMA
+    ),
+    types.Tool(
+        name="get_snapshots",
+        description="List all snapshots for a VM",
+        inputSchema=_SNAPSHOTS_SCHEMA
+    )
+]
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """Return list of available tools"""
-    return [
-        types.Tool(
-            name="list_resources",
-            description="List all VMs and containers in Proxmox cluster",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        types.Tool(
-            name="get_resource_status",
-            description="Get detailed status of a specific VM or container",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vmid": {
-                        "type": "string",
-                        "description": "VM/Container ID"
-                    },
-                    "node": {
-                        "type": "string",
-                        "description": "Proxmox node name"
-                    }
-                },
-                "required": ["vmid", "node"]
-            }
-        ),
-        types.Tool(
-            name="start_resource",
-            description="Start a VM or container",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vmid": {
-                        "type": "string",
-                        "description": "VM/Container ID"
-                    },
-                    "node": {
-                        "type": "string",
-                        "description": "Proxmox node name"
-                    }
-                },
-                "required": ["vmid", "node"]
-            }
-        ),
-        types.Tool(
-            name="stop_resource",
-            description="Stop a VM or container",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vmid": {
-                        "type": "string",
-                        "description": "VM/Container ID"
-                    },
-                    "node": {
-                        "type": "string",
-                        "description": "Proxmox node name"
-                    }
-                },
-                "required": ["vmid", "node"]
-            }
-        ),
-        types.Tool(
-            name="shutdown_resource",
-            description="Gracefully shutdown a VM or container",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vmid": {
-                        "type": "string",
-                        "description": "VM/Container ID"
-                    },
-                    "node": {
-                        "type": "string",
-                        "description": "Proxmox node name"
-                    }
-                },
-                "required": ["vmid", "node"]
-            }
-        ),
-        types.Tool(
-            name="restart_resource",
-            description="Restart a VM or container",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vmid": {
-                        "type": "string",
-                        "description": "VM/Container ID"
-                    },
-                    "node": {
-                        "type": "string",
-                        "description": "Proxmox node name"
-                    }
-                },
-                "required": ["vmid", "node"]
-            }
-        ),
-        types.Tool(
-            name="create_snapshot",
-            description="Create a snapshot of a VM",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vmid": {
-                        "type": "string",
-                        "description": "VM ID"
-                    },
-                    "node": {
-                        "type": "string",
-                        "description": "Proxmox node name"
-                    },
-                    "snapname": {
-                        "type": "string",
-                        "description": "Snapshot name"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Snapshot description",
-                        "default": ""
-                    }
-                },
-                "required": ["vmid", "node", "snapname"]
-            }
-        ),
-        types.Tool(
-            name="delete_snapshot",
-            description="Delete a snapshot of a VM",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vmid": {
-                        "type": "string",
-                        "description": "VM ID"
-                    },
-                    "node": {
-                        "type": "string",
-                        "description": "Proxmox node name"
-                    },
-                    "snapname": {
-                        "type": "string",
-                        "description": "Snapshot name"
-                    }
-                },
-                "required": ["vmid", "node", "snapname"]
-            }
-        ),
-        types.Tool(
-            name="get_snapshots",
-            description="List all snapshots for a VM",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vmid": {
-                        "type": "string",
-                        "description": "VM ID"
-                    },
-                    "node": {
-                        "type": "string",
-                        "description": "Proxmox node name"
-                    }
-                },
-                "required": ["vmid", "node"]
-            }
+    return _TOOLS
+
+class _MissingArg(Exception):
+    """Raised by _require when a tool call lacks a required argument."""
+
+def _require(arguments: dict, *keys: str) -> tuple:
+    """Return the values for keys, raising _MissingArg if any is empty."""
+    values = tuple(arguments.get(k) for k in keys)
+    if not all(values):
+        if len(keys) > 2:
+            names = f"{', '.join(keys[:-1])}, and {keys[-1]}"
+        else:
+            names = " and ".join(keys)
+        raise _MissingArg(f"{names} are required")
+    return values
+
+async def _handle_list_resources(service, arguments: dict) -> list[types.TextContent]:
+    result = await service.list_resources()
+    resources = result.get('resources', [])
+    
+    if not resources:
+        return [types.TextContent(type="text", text="No resources found in Proxmox cluster")]
+    
+    # One content item per resource, so no single string holds the whole listing
+    contents = [types.TextContent(type="text", text=f"Found {len(resources)} resources:\n\n")]
+    contents.extend(
+        types.TextContent(
+            type="text",
+            text=f"• **{r['name']}** (ID: {r['vmid']})\n"
+                 f"  - Status: {r['status']}\n"
+                 f"  - Node: {r['node']}\n"
+                 f"  - Type: {r.get('type', 'unknown')}\n"
+                 f"  - Uptime: {r.get('uptime', 'unknown')} seconds\n\n"
+        )
+        for r in resources
+    )
+    return contents
+
+# Coalesces concurrent identical upstream calls, keyed by (operation, *args)
+_inflight = SingleFlight()
+
+async def _handle_get_resource_status(service, arguments: dict) -> list[types.TextContent]:
+    vmid, node = _require(arguments, "vmid", "node")
+    
+    result = await _inflight.do(
+        ("get_resource_status", vmid, node),
+        lambda: service.get_resource_status(vmid, node)
+    )
+    
+    output = f"**Status for {vmid}:**\n\n"
+    output += f"• Node: {result.get('node', 'Unknown')}\n"
+    output += f"• Status: {result.get('status', 'Unknown')}\n"
+    output += f"• CPU Usage: {result.get('cpu', 'Unknown')}\n"
+    output += f"• Memory Usage: {result.get('memory', 'Unknown')}\n"
+    output += f"• Disk Usage: {result.get('disk', 'Unknown')}\n"
+    output += f"• Uptime: {result.get('uptime', 'Unknown')} seconds\n"
+    
+    return [types.TextContent(type="text", text=output)]
+
+# Response templates for the simple command tools
+_START_TMPL = "✅ Start command sent to {vmid}: {msg}"
+_STOP_TMPL = "🛑 Stop command sent to {vmid}: {msg}"
+_SHUTDOWN_TMPL = "🔽 Shutdown command sent to {vmid}: {msg}"
+_RESTART_TMPL = "🔄 Restart command sent to {vmid}: {msg}"
+_CREATE_SNAPSHOT_TMPL = "📸 Snapshot '{snapname}' created for {vmid}: {msg}"
+_DELETE_SNAPSHOT_TMPL = "🗑️ Snapshot '{snapname}' deleted from {vmid}: {msg}"
+
+async def _handle_start_resource(service, arguments: dict) -> list[types.TextContent]:
+    vmid, node = _require(arguments, "vmid", "node")
+    
+    result = await service.start_resource(vmid, node)
+    return [types.TextContent(type="text", text=_START_TMPL.format(vmid=vmid, msg=result.get('message', 'Success')))]
+
+async def _handle_stop_resource(service, arguments: dict) -> list[types.TextContent]:
+    vmid, node = _require(arguments, "vmid", "node")
+    
+    result = await service.stop_resource(vmid, node)
+    return [types.TextContent(type="text", text=_STOP_TMPL.format(vmid=vmid, msg=result.get('message', 'Success')))]
+
+async def _handle_shutdown_resource(service, arguments: dict) -> list[types.TextContent]:
+    vmid, node = _require(arguments, "vmid", "node")
+    
+    result = await service.shutdown_resource(vmid, node)
+    return [types.TextContent(type="text", text=_SHUTDOWN_TMPL.format(vmid=vmid, msg=result.get('message', 'Success')))]
+
+async def _handle_restart_resource(service, arguments: dict) -> list[types.TextContent]:
+    vmid, node = _require(arguments, "vmid", "node")
+    
+    result = await service.restart_resource(vmid, node)
+    return [types.TextContent(type="text", text=_RESTART_TMPL.format(vmid=vmid, msg=result.get('message', 'Success')))]
+
+async def _handle_create_snapshot(service, arguments: dict) -> list[types.TextContent]:
+    vmid, node, snapname = _require(arguments, "vmid", "node", "snapname")
+    description = arguments.get("description", "")
+    
+    result = await service.create_snapshot(vmid, node, snapname, description)
+    return [types.TextContent(type="text", text=_CREATE_SNAPSHOT_TMPL.format(snapname=snapname, vmid=vmid, msg=result.get('message', 'Success')))]
+
+async def _handle_delete_snapshot(service, arguments: dict) -> list[types.TextContent]:
+    vmid, node, snapname = _require(arguments, "vmid", "node", "snapname")
+    
+    result = await service.delete_snapshot(vmid, node, snapname)
+    return [types.TextContent(type="text", text=_DELETE_SNAPSHOT_TMPL.format(snapname=snapname, vmid=vmid, msg=result.get('message', 'Success')))]
+
+async def _handle_get_snapshots(service, arguments: dict) -> list[types.TextContent]:
+    vmid, node = _require(arguments, "vmid", "node")
+    
+    result = await service.get_snapshots(vmid, node)
+    
+    snapshots = result.get('snapshots', [])
+    if not snapshots:
+        output = f"No snapshots found for {vmid}"
+    else:
+        parts = [f"**Snapshots for {vmid}:**\n\n"]
+        parts.extend(
+            f"• **{snap['name']}**\n"
+            f"  - Description: {snap.get('description', 'No description')}\n"
+            f"  - Date: {snap.get('snaptime', 'Unknown')}\n\n"
+            for snap in snapshots
         )
-    ]
+        output = "".join(parts)
+    
+    return [types.TextContent(type="text", text=output)]
+
+# Read-only tools whose rendered output is reused for a few seconds (TTL in seconds);
+# each cache keeps at most 128 argument variants, least recently used evicted first
+_CACHE_TTLS = {
+    "list_resources": 3.0,
+    "get_snapshots": 10.0,
+}
+_RESULT_CACHES = {name: AsyncTTLCache(ttl=ttl) for name, ttl in _CACHE_TTLS.items()}
+
+# Mutating tools -> cached tools whose output they make stale
+_INVALIDATES = {
+    "start_resource": ("list_resources",),
+    "stop_resource": ("list_resources",),
+    "shutdown_resource": ("list_resources",),
+    "restart_resource": ("list_resources",),
+    "create_snapshot": ("get_snapshots",),
+    "delete_snapshot": ("get_snapshots",),
+}
+
+async def _cached_call(name: str, handler, service, arguments: dict) -> list[types.TextContent]:
+    """Serve a read-only tool from the TTL cache, coalescing concurrent misses."""
+    key = tuple(sorted(arguments.items()))
+    cache = _RESULT_CACHES[name]
+    result = await cache.get(key, lambda: handler(service, arguments))
+    logger.debug("%s cache: %d hits, %d misses", name, cache.hits, cache.misses)
+    return result
+
+# Tool name -> handler coroutine, looked up once per call
+_HANDLERS: dict[str, Callable[[Any, dict], Awaitable[list[types.TextContent]]]] = {
+    "list_resources": _handle_list_resources,
+    "get_resource_status": _handle_get_resource_status,
+    "start_resource": _handle_start_resource,
+    "stop_resource": _handle_stop_resource,
+    "shutdown_resource": _handle_shutdown_resource,
+    "restart_resource": _handle_restart_resource,
+    "create_snapshot": _handle_create_snapshot,
+    "delete_snapshot": _handle_delete_snapshot,
+    "get_snapshots": _handle_get_snapshots,
+}
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict | None) -> list[types.TextContent]:
@@ -239,151 +396,42 @@ async def handle_call_tool(name: str, arguments: dict | None) -> list[types.Text
     if arguments is None:
         arguments = {}
     
-    try:
-        if name == "list_resources":
-            result = await service.list_resources()
-            resources = result.get('resources', [])
-            
-            if not resources:
-                output = "No resources found in Proxmox cluster"
-            else:
-                output = f"Found {len(resources)} resources:\n\n"
-                for r in resources:
-                    output += f"• **{r['name']}** (ID: {r['vmid']})\n"
-                    output += f"  - Status: {r['status']}\n"
-                    output += f"  - Node: {r['node']}\n"
-                    output += f"  - Type: {r.get('type', 'unknown')}\n"
-                    output += f"  - Uptime: {r.get('uptime', 'unknown')} seconds\n\n"
-            
-            return [types.TextContent(type="text", text=output)]
-        
-        elif name == "get_resource_status":
-            vmid = arguments.get("vmid")
-            node = arguments.get("node")
-            
-            if not vmid or not node:
-                return [types.TextContent(type="text", text="❌ Error: vmid and node are required")]
-            
-            result = await service.get_resource_status(vmid, node)
-            
-            output = f"**Status for {vmid}:**\n\n"
-            output += f"• Node: {result.get('node', 'Unknown')}\n"
-            output += f"• Status: {result.get('status', 'Unknown')}\n"
-            output += f"• CPU Usage: {result.get('cpu', 'Unknown')}\n"
-            output += f"• Memory Usage: {result.get('memory', 'Unknown')}\n"
-            output += f"• Disk Usage: {result.get('disk', 'Unknown')}\n"
-            output += f"• Uptime: {result.get('uptime', 'Unknown')} seconds\n"
-            
-            return [types.TextContent(type="text", text=output)]
-        
-        elif name == "start_resource":
-            vmid = arguments.get("vmid")
-            node = arguments.get("node")
-            
-            if not vmid or not node:
-                return [types.TextContent(type="text", text="❌ Error: vmid and node are required")]
-            
-            result = await service.start_resource(vmid, node)
-            return [types.TextContent(type="text", text=f"✅ Start command sent to {vmid}: {result.get('message', 'Success')}")]
-        
-        elif name == "stop_resource":
-            vmid = arguments.get("vmid")
-            node = arguments.get("node")
-            
-            if not vmid or not node:
-                return [types.TextContent(type="text", text="❌ Error: vmid and node are required")]
-            
-            result = await service.stop_resource(vmid, node)
-            return [types.TextContent(type="text", text=f"🛑 Stop command sent to {vmid}: {result.get('message', 'Success')}")]
-        
-        elif name == "shutdown_resource":
-            vmid = arguments.get("vmid")
-            node = arguments.get("node")
-            
-            if not vmid or not node:
-                return [types.TextContent(type="text", text="❌ Error: vmid and node are required")]
-            
-            result = await service.shutdown_resource(vmid, node)
-            return [types.TextContent(type="text", text=f"🔽 Shutdown command sent to {vmid}: {result.get('message', 'Success')}")]
-        
-        elif name == "restart_resource":
-            vmid = arguments.get("vmid")
-            node = arguments.get("node")
-            
-            if not vmid or not node:
-                return [types.TextContent(type="text", text="❌ Error: vmid and node are required")]
-            
-            result = await service.restart_resource(vmid, node)
-            return [types.TextContent(type="text", text=f"🔄 Restart command sent to {vmid}: {result.get('message', 'Success')}")]
-        
-        elif name == "create_snapshot":
-            vmid = arguments.get("vmid")
-            node = arguments.get("node")
-            snapname = arguments.get("snapname")
-            description = arguments.get("description", "")
-            
-            if not vmid or not node or not snapname:
-                return [types.TextContent(type="text", text="❌ Error: vmid, node, and snapname are required")]
-            
-            result = await service.create_snapshot(vmid, node, snapname, description)
-            return [types.TextContent(type="text", text=f"📸 Snapshot '{snapname}' created for {vmid}: {result.get('message', 'Success')}")]
-        
-        elif name == "delete_snapshot":
-            vmid = arguments.get("vmid")
-            node = arguments.get("node")
-            snapname = arguments.get("snapname")
-            
-            if not vmid or not node or not snapname:
-                return [types.TextContent(type="text", text="❌ Error: vmid, node, and snapname are required")]
-            
-            result = await service.delete_snapshot(vmid, node, snapname)
-            return [types.TextContent(type="text", text=f"🗑️ Snapshot '{snapname}' deleted from {vmid}: {result.get('message', 'Success')}")]
-        
-        elif name == "get_snapshots":
-            vmid = arguments.get("vmid")
-            node = arguments.get("node")
-            
-            if not vmid or not node:
-                return [types.TextContent(type="text", text="❌ Error: vmid and node are required")]
-            
-            result = await service.get_snapshots(vmid, node)
-            
-            snapshots = result.get('snapshots', [])
-            if not snapshots:
-                output = f"No snapshots found for {vmid}"
-            else:
-                output = f"**Snapshots for {vmid}:**\n\n"
-                for snap in snapshots:
-                    output += f"• **{snap['name']}**\n"
-                    output += f"  - Description: {snap.get('description', 'No description')}\n"
-                    output += f"  - Date: {snap.get('snaptime', 'Unknown')}\n\n"
-            
-            return [types.TextContent(type="text", text=output)]
-        
-        else:
-            return [types.TextContent(type="text", text=f"❌ Unknown tool: {name}")]
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return [types.TextContent(type="text", text=f"❌ Unknown tool: {name}")]
     
+    try:
+        if name in _CACHE_TTLS:
+            return await _cached_call(name, handler, service, arguments)
+        result = await handler(service, arguments)
+        for cached in _INVALIDATES.get(name, ()):
+            _RESULT_CACHES[cached].invalidate()
+        return result
+    except _MissingArg as e:
+        return [types.TextContent(type="text", text=f"❌ Error: {e}")]
     except Exception as e:
-        logger.error(f"Error executing tool {name}: {e}")
+        logger.error("Error executing tool %s: %s", name, e)
         return [types.TextContent(type="text", text=f"❌ Error executing {name}: {str(e)}")]
 
+_RESOURCES = [
+    types.Resource(
+        uri="proxmox://cluster/status",
+        name="Cluster Status",
+        description="Get Proxmox cluster status",
+        mimeType="application/json"
+    ),
+    types.Resource(
+        uri="proxmox://nodes/status",
+        name="Nodes Status", 
+        description="Get Proxmox nodes status",
+        mimeType="application/json"
+    )
+]
+
 @server.list_resources()
 async def handle_list_resources() -> list[types.Resource]:
     """Return list of available resources"""
-    return [
-        types.Resource(
-            uri="proxmox://cluster/status",
-            name="Cluster Status",
-            description="Get Proxmox cluster status",
-            mimeType="application/json"
-        ),
-        types.Resource(
-            uri="proxmox://nodes/status",
-            name="Nodes Status", 
-            description="Get Proxmox nodes status",
-            mimeType="application/json"
-        )
-    ]
+    return _RESOURCES
 
 @server.read_resource()
 async def handle_read_resource(uri: str) -> str:
@@ -395,23 +443,27 @@ async def handle_read_resource(uri: str) -> str:
     try:
         if uri == "proxmox://cluster/status":
             result = await service.get_cluster_status()
-            return json.dumps(result, indent=2)
+            return _dumps(result, indent=True)
         elif uri == "proxmox://nodes/status":
             result = await service.get_nodes_status()
-            return json.dumps(result, indent=2)
+            return _dumps(result, indent=True)
         else:
             raise ValueError(f"Unknown resource URI: {uri}")
     except Exception as e:
-        logger.error(f"Error reading resource {uri}: {e}")
+        logger.error("Error reading resource %s: %s", uri, e)
         raise
 
 async def run_sse_server():
     """Run the SSE server"""
+    # Load environment variables
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     # Get configuration from environment
     host = os.getenv("MCP_HOST", "0.0.0.0")
     port = int(os.getenv("MCP_PORT", "8001"))
     
-    logger.info(f"🚀 Starting Proxmox MCP Server (Lower-Level SDK) on {host}:{port}")
+    logger.info("🚀 Starting Proxmox MCP Server (Lower-Level SDK) on %s:%d", host, port)
     
     # Create initialization options
     init_options = InitializationOptions(
@@ -427,26 +479,30 @@ async def run_sse_server():
     sse_transport = SseServerTransport("/messages")
     
     async def handle_sse(request):
-        from starlette.responses import Response
         async with sse_transport.connect_sse(request.scope, request.receive, request._send) as streams:
             await server.run(streams[0], streams[1], init_options)
         return Response()
     
     async def handle_messages(request):
-        from starlette.responses import Response
         await sse_transport.handle_post_message(request.scope, request.receive, request._send)
         return Response()
     
+    class FastJSONResponse(Response):
+        """JSON response rendered with the fastest available encoder."""
+        media_type = "application/json"
+        
+        def render(self, content: Any) -> bytes:
+            return _dumpb(content)
+    
     # Health check endpoint
     async def health_check(request):
-        from starlette.responses import JSONResponse
         response = {
             "status": "ok",
             "server": "proxmox-mcp-server",
             "transport": "sse",
             "version": "1.0.0"
         }
-        return JSONResponse(response)
+        return FastJSONResponse(response)
     
     from starlette.applications import Starlette
     from starlette.routing import Route
@@ -470,28 +526,18 @@ async def run_sse_server():
     await uvicorn_server.serve()
 
 if __name__ == "__main__":
-    import sys
-    
-    # Parse command line arguments
-    if len(sys.argv) > 1 and sys.argv[1] in ["--help", "-h"]:
-        print("Proxmox MCP Server - Lower-Level MCP SDK")
-        print("Usage: python lowlevel_server.py")
-        print()
-        print("Environment variables required:")
-        print("  PROXMOX_HOST       Proxmox VE host")
-        print("  PROXMOX_USER       Proxmox VE username")
-        print("  PROXMOX_PASSWORD   Proxmox VE password")
-        print()
-        print("Environment variables optional:")
-        print("  MCP_PORT          Server port (default: 8001)")
-        print("  MCP_HOST          Server host (default: 0.0.0.0)")
-        sys.exit(0)
+    # Prefer uvloop's event loop; fall back to asyncio's where it isn't available
+    try:
+        import uvloop
+        run = uvloop.run  # added in uvloop 0.18
+    except (ImportError, AttributeError):
+        run = asyncio.run
     
     # Run the SSE server
     try:
-        asyncio.run(run_sse_server())
+        run(run_sse_server())
     except KeyboardInterrupt:
         logger.info("🔽 Server stopped by user")
     except Exception as e:
-        logger.error(f"❌ Server error: {e}")
+        logger.error("❌ Server error: %s", e)
         sys.exit(1) 
\ No newline at end of file
@@ -100,8 +100,6 @@ async def test_new_tools():
                 
             except Exception as e:
                 print(f"  ❌ {test_name}: Failed - {e}")
-            
-            await asyncio.sleep(0.1)  # Small delay
     
     print(f"\n🎯 Results: {passed}/{total_tests} tests passed ({passed/total_tests*100:.1f}%)")
     
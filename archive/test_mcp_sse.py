@@ -4,7 +4,7 @@ Test MCP SSE protocol to debug Cursor IDE issues
 """
 
 import asyncio
-import aiohttp
+import httpx
 import json
 import os
 import sys
@@ -13,6 +13,13 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# One long-lived client for every probe so keep-alive connections are reused.
+# Plain http:// never negotiates HTTP/2, so http2 stays off (and needs no h2 extra).
+_client = httpx.AsyncClient(
+    timeout=5.0,
+    limits=httpx.Limits(max_connections=32, keepalive_expiry=30)
+)
+
 async def test_mcp_sse():
     """Test the MCP SSE protocol like Cursor IDE would"""
     print("🧪 Testing MCP SSE Protocol...")
@@ -43,29 +50,33 @@ async def test_mcp_sse():
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            print(f"📡 Connecting to {url}...")
+        print(f"📡 Connecting to {url}...")
+        
+        # Test SSE connection; a short read timeout keeps a silent stream from hanging the probe
+        async with _client.stream("GET", url, headers={
+            'Accept': 'text/event-stream',
+            'Cache-Control': 'no-cache'
+        }, timeout=httpx.Timeout(5.0, read=1.0)) as resp:
+            print(f"✅ Connected! Status: {resp.status_code}")
+            print(f"Headers: {dict(resp.headers)}")
             
-            # Test SSE connection
-            async with session.get(url, headers={
-                'Accept': 'text/event-stream',
-                'Cache-Control': 'no-cache'
-            }) as resp:
-                print(f"✅ Connected! Status: {resp.status}")
-                print(f"Headers: {dict(resp.headers)}")
-                
-                if resp.status == 200:
-                    print("\n📨 Reading SSE stream...")
-                    async for line in resp.content:
-                        line_str = line.decode('utf-8').strip()
-                        if line_str:
-                            print(f"Received: {line_str}")
-                            # Only read a few lines to avoid hanging
-                            if "data:" in line_str:
-                                break
+            content_type = resp.headers.get("content-type", "")
+            if resp.status_code != 200:
+                print(f"❌ Failed with status {resp.status_code}")
+            elif "text/event-stream" not in content_type:
+                print(f"❌ Unexpected content type: {content_type}")
+            else:
+                # The first event frame proves the stream is live; leaving the
+                # block closes it so no half-open SSE session stays on the server
+                print("\n📨 Reading first SSE event...")
+                async for line in resp.aiter_lines():
+                    line_str = line.strip()
+                    if line_str:
+                        print(f"Received: {line_str}")
+                        break
                 else:
-                    print(f"❌ Failed with status {resp.status}")
-                    
+                    print("❌ Stream closed before any event")
+                
     except Exception as e:
         print(f"❌ Error: {e}")
 
@@ -94,24 +105,29 @@ async def test_messages_endpoint():
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            print(f"📡 Posting to {url}...")
-            
-            async with session.post(url, 
-                                   json=init_message,
-                                   headers={'Content-Type': 'application/json'}) as resp:
-                print(f"Status: {resp.status}")
-                if resp.status == 200:
-                    result = await resp.json()
-                    print(f"✅ Response: {json.dumps(result, indent=2)}")
-                else:
-                    text = await resp.text()
-                    print(f"❌ Error response: {text}")
-                    
+        print(f"📡 Posting to {url}...")
+        
+        resp = await _client.post(url,
+                                  json=init_message,
+                                  headers={'Content-Type': 'application/json'})
+        print(f"Status: {resp.status_code}")
+        if resp.status_code == 200:
+            result = resp.json()
+            print(f"✅ Response: {json.dumps(result, indent=2)}")
+        else:
+            print(f"❌ Error response: {resp.text}")
+                
     except Exception as e:
         print(f"❌ Error: {e}")
 
+async def main():
+    """Run both probes concurrently on one event loop and shared client."""
+    try:
+        # The probes are independent, so wall-clock is the slower of the two
+        await asyncio.gather(test_mcp_sse(), test_messages_endpoint(), return_exceptions=True)
+    finally:
+        await _client.aclose()
+
 if __name__ == "__main__":
     print("🚀 MCP SSE Debug Test\n")
-    asyncio.run(test_mcp_sse())
-    asyncio.run(test_messages_endpoint()) 
\ No newline at end of file
+    asyncio.run(main())
@@ -5,17 +5,43 @@ A standards-compliant MCP server for managing Proxmox VE resources via Server-Se
 """
 
 import os
+import sys
+import argparse
+import json
+import asyncio
 import logging
-from dotenv import load_dotenv
+from collections import defaultdict
+from itertools import groupby
+import uvicorn
 from mcp.server.fastmcp import FastMCP
+from mcp.types import ToolAnnotations
 
-# Load environment variables
-load_dotenv()
+# C-accelerated JSON for resource payloads when orjson is installed
+try:
+    import orjson
 
-# Import our service
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2, separators=(",", ": "))
+
+# Load environment variables, preferring the snapshot from scripts/compile_env.py
+try:
+    from _env_cache import ENV
+    for _key, _value in ENV.items():
+        os.environ.setdefault(_key, _value)
+except ImportError:
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# Import our service (src is a package next to this script)
 from src.unified_service import ProxmoxService
+from src.cache import AsyncTTLCache, SingleFlight
+from src.config import (
+    DEFAULT_MCP_HOST, DEFAULT_MCP_PORT, MCP_HOST, MCP_PORT, MCP_MAX_SSE_CONNECTIONS,
+    PROXMOX_CACHE_TTL, PROXMOX_CACHE_STALE_TTL, PROXMOX_HOST, PROXMOX_USER, PROXMOX_PASSWORD
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -24,164 +50,209 @@ logger = logging.getLogger(__name__)
 # Create MCP server
 mcp = FastMCP("Proxmox MCP Server")
 
+# Hint for clients that list/get tools only read and are safe to retry
+_READ_ONLY = ToolAnnotations(readOnlyHint=True, idempotentHint=True)
+
+# --help output, built once and written in one go
+_HELP = f"""\
+Proxmox MCP Server - SSE Transport
+Usage: python mcp_server.py [--mount-path PATH]
+
+Options:
+  --mount-path PATH  SSE mount path (optional)
+  --help, -h         Show this help message
+
+Environment variables required:
+  PROXMOX_HOST       Proxmox VE host
+  PROXMOX_USER       Proxmox VE username
+  PROXMOX_PASSWORD   Proxmox VE password
+
+Environment variables optional:
+  MCP_PORT          Server port (default: {DEFAULT_MCP_PORT})
+  MCP_HOST          Server host (default: {DEFAULT_MCP_HOST})
+"""
+
+# Command line parser, built once; --help prints _HELP above
+_parser = argparse.ArgumentParser(prog="mcp_server.py", add_help=False)
+_parser.add_argument("--mount-path", dest="mount_path", default=None)
+_parser.add_argument("--help", "-h", action="store_true")
+
+# Short-lived cache for read-only listings polled by dashboards; with a stale
+# window configured, expired entries are served while one background task refreshes them
+_api_cache = AsyncTTLCache(ttl=PROXMOX_CACHE_TTL, stale_ttl=PROXMOX_CACHE_STALE_TTL)
+
+def _invalidate(*names: str):
+    """Drop the cached listings (all argument variants) a mutating tool made stale."""
+    for name in names:
+        _api_cache.invalidate_prefix(name)
+
+# Coalesces concurrent identical per-VM lookups into one upstream call
+_inflight = SingleFlight()
+
 # Initialize service after environment is loaded
 service = None
-_service_initialization_lock = None
+# Created up front so concurrent first calls share one lock (it binds its loop lazily)
+_service_initialization_lock = asyncio.Lock()
 
 async def get_service():
-    """Get the service (with fallback lazy initialization if pre-init failed)."""
-    global service, _service_initialization_lock
+    """Get the service (with fallback lazy initialization if pre-init failed).
     
-    if service is None:
-        # Fallback lazy initialization if pre-initialization failed
-        import asyncio
-        if _service_initialization_lock is None:
-            _service_initialization_lock = asyncio.Lock()
-        
+    Tools call this as `service or await get_service()`, so once the service
+    exists the warm path skips this coroutine entirely.
+    """
+    svc = service
+    if svc is None:
         async with _service_initialization_lock:
             # Double-check pattern
-            if service is None:
-                logger.warning("⚠️ Service not pre-initialized, initializing now...")
+            svc = service
+            if svc is None:
+                logger.info("🔄 Initializing Proxmox service...")
                 await init_service()
+                svc = service
     
-    return service
+    return svc
 
-@mcp.tool()
+@mcp.tool(annotations=_READ_ONLY)
 async def list_resources() -> str:
     """List all VMs and containers in Proxmox cluster"""
     try:
-        result = await (await get_service()).list_resources()
+        result = await _api_cache.get("list_resources", (service or await get_service()).list_resources)
         resources = result.get('resources', [])
         
         if not resources:
             return "No resources found in Proxmox cluster"
         
-        output = f"Found {len(resources)} resources:\n\n"
+        parts = [f"Found {len(resources)} resources:\n\n"]
         for r in resources:
-            output += f"• **{r['name']}** (ID: {r['vmid']})\n"
-            output += f"  - Status: {r['status']}\n"
-            output += f"  - Node: {r['node']}\n"
-            output += f"  - Type: {r.get('type', 'unknown')}\n"
-            output += f"  - Uptime: {r.get('uptime', 'unknown')} seconds\n\n"
-        
-        return output
+            parts.append(
+                f"• **{r['name']}** (ID: {r['vmid']})\n"
+                f"  - Status: {r['status']}\n"
+                f"  - Node: {r['node']}\n"
+                f"  - Type: {r['type']}\n"
+                f"  - Uptime: {r['uptime']} seconds\n\n"
+            )
+        
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error listing resources: {e}")
         return f"❌ Error listing resources: {str(e)}"
 
-@mcp.tool()
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+def _format_bytes(bytes_val) -> str:
+    """Format a byte count as a human readable size."""
+    if not bytes_val:
+        return "0 B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    idx = min(max(int(bytes_val).bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_val / (1 << (idx * 10)):.1f} {_BYTE_UNITS[idx]}"
+
+def _format_cpu(cpu_val) -> str:
+    """Format a CPU load fraction as a percentage."""
+    if cpu_val is None or cpu_val == 'Unknown':
+        return "Unknown"
+    return f"{float(cpu_val) * 100:.2f}%"
+
+def _format_memory(mem_bytes, max_mem_bytes) -> str:
+    """Format used / total memory in GB with the usage percentage."""
+    if not mem_bytes or not max_mem_bytes:
+        return "Unknown"
+    mem_gb = mem_bytes / (1024**3)
+    max_gb = max_mem_bytes / (1024**3)
+    percentage = (mem_bytes / max_mem_bytes) * 100
+    return f"{mem_gb:.1f} GB / {max_gb:.1f} GB ({percentage:.1f}%)"
+
+# Fallbacks for fields the status endpoint may omit, merged in one step
+_STATUS_DEFAULTS = {
+    'name': 'Unknown', 'status': 'Unknown', 'type': 'qemu', 'cpu': None,
+    'cpus': 'Unknown', 'mem': None, 'maxmem': None, 'disk': 0, 'uptime': 0,
+}
+
+_STATUS_TMPL = (
+    "**Status for {vmid} ({name}):**\n\n"
+    "• Node: {node}\n"
+    "• Status: {status}\n"
+    "• Type: {type}\n"
+    "• CPU Usage: {cpu}\n"
+    "• CPU Cores: {cpus}\n"
+    "• Memory Usage: {memory}\n"
+    "• Disk Usage: {disk}\n"
+    "• Uptime: {uptime}\n"
+)
+
+@mcp.tool(annotations=_READ_ONLY)
 async def get_resource_status(vmid: str, node: str) -> str:
     """Get detailed status of a specific VM or container"""
     try:
-        result = await (await get_service()).get_resource_status(vmid, node)
-        
-        # Helper function to format bytes to human readable
-        def format_bytes(bytes_val):
-            if not bytes_val or bytes_val == 0:
-                return "0 B"
-            for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                if bytes_val < 1024.0:
-                    return f"{bytes_val:.1f} {unit}"
-                bytes_val /= 1024.0
-            return f"{bytes_val:.1f} PB"
-        
-        # Helper function to format CPU usage
-        def format_cpu(cpu_val):
-            if cpu_val is None or cpu_val == 'Unknown':
-                return "Unknown"
-            return f"{float(cpu_val) * 100:.2f}%"
-        
-        # Helper function to format memory usage
-        def format_memory(mem_bytes, max_mem_bytes):
-            if not mem_bytes or not max_mem_bytes:
-                return "Unknown"
-            mem_gb = mem_bytes / (1024**3)
-            max_gb = max_mem_bytes / (1024**3)
-            percentage = (mem_bytes / max_mem_bytes) * 100
-            return f"{mem_gb:.1f} GB / {max_gb:.1f} GB ({percentage:.1f}%)"
-        
-        output = f"**Status for {vmid} ({result.get('name', 'Unknown')}):**\n\n"
-        output += f"• Node: {node}\n"
-        output += f"• Status: {result.get('status', 'Unknown')}\n"
-        output += f"• Type: {result.get('type', 'qemu')}\n"
-        output += f"• CPU Usage: {format_cpu(result.get('cpu'))}\n"
-        output += f"• CPU Cores: {result.get('cpus', 'Unknown')}\n"
-        
-        # Format memory usage
-        mem_usage = format_memory(result.get('mem'), result.get('maxmem'))
-        output += f"• Memory Usage: {mem_usage}\n"
-        
-        # Format disk usage
-        disk_bytes = result.get('disk', 0)
-        output += f"• Disk Usage: {format_bytes(disk_bytes)}\n"
+        svc = service or await get_service()
+        result = await _inflight.do(("get_resource_status", vmid, node),
+                                    lambda: svc.get_resource_status(vmid, node))
+        
+        r = {**_STATUS_DEFAULTS, **result}
         
         # Format uptime
-        uptime = result.get('uptime', 0)
+        uptime = r['uptime']
         if uptime:
-            days = uptime // 86400
-            hours = (uptime % 86400) // 3600
-            minutes = (uptime % 3600) // 60
+            days, rem = divmod(uptime, 86400)
+            hours, rem = divmod(rem, 3600)
+            minutes = rem // 60
             if days > 0:
                 uptime_str = f"{days}d {hours}h {minutes}m"
             elif hours > 0:
                 uptime_str = f"{hours}h {minutes}m"
             else:
                 uptime_str = f"{minutes}m"
-            output += f"• Uptime: {uptime_str} ({uptime} seconds)\n"
+            uptime_str = f"{uptime_str} ({uptime} seconds)"
         else:
-            output += f"• Uptime: Unknown\n"
-        
-        return output
+            uptime_str = "Unknown"
+        
+        return _STATUS_TMPL.format(
+            vmid=vmid, node=node, name=r['name'], status=r['status'], type=r['type'],
+            cpu=_format_cpu(r['cpu']), cpus=r['cpus'],
+            memory=_format_memory(r['mem'], r['maxmem']),
+            disk=_format_bytes(r['disk']), uptime=uptime_str,
+        )
     except Exception as e:
         logger.error(f"Error getting status for {vmid}: {e}")
         return f"❌ Error getting status for {vmid}: {str(e)}"
 
-@mcp.tool()
-async def start_resource(vmid: str, node: str) -> str:
-    """Start a VM or container"""
-    try:
-        result = await (await get_service()).start_resource(vmid, node)
-        return f"✅ Start command sent to {vmid}: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error starting {vmid}: {e}")
-        return f"❌ Error starting {vmid}: {str(e)}"
+# Power actions: (tool name, description, response template, verb for error messages)
+_POWER_TOOLS = [
+    ("start_resource", "Start a VM or container", "✅ Start command sent to {vmid}: {msg}", "starting"),
+    ("stop_resource", "Stop a VM or container", "🛑 Stop command sent to {vmid}: {msg}", "stopping"),
+    ("shutdown_resource", "Gracefully shutdown a VM or container", "🔽 Shutdown command sent to {vmid}: {msg}", "shutting down"),
+    ("restart_resource", "Restart a VM or container", "🔄 Restart command sent to {vmid}: {msg}", "restarting"),
+]
 
-@mcp.tool()
-async def stop_resource(vmid: str, node: str) -> str:
-    """Stop a VM or container"""
-    try:
-        result = await (await get_service()).stop_resource(vmid, node)
-        return f"🛑 Stop command sent to {vmid}: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error stopping {vmid}: {e}")
-        return f"❌ Error stopping {vmid}: {str(e)}"
+def _make_power_tool(name: str, description: str, template: str, verb: str):
+    """Build and register one power-action tool; all share this code object."""
+    async def tool(vmid: str, node: str) -> str:
+        try:
+            result = await getattr(service or await get_service(), name)(vmid, node)
+            _invalidate("list_resources")
+            return template.format(vmid=vmid, msg=result.get('message', 'Success'))
+        except Exception as e:
+            logger.error(f"Error {verb} {vmid}: {e}")
+            return f"❌ Error {verb} {vmid}: {str(e)}"
+    
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = description
+    return mcp.tool(name=name, description=description)(tool)
 
-@mcp.tool()
-async def shutdown_resource(vmid: str, node: str) -> str:
-    """Gracefully shutdown a VM or container"""
-    try:
-        result = await (await get_service()).shutdown_resource(vmid, node)
-        return f"🔽 Shutdown command sent to {vmid}: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error shutting down {vmid}: {e}")
-        return f"❌ Error shutting down {vmid}: {str(e)}"
+start_resource, stop_resource, shutdown_resource, restart_resource = (
+    _make_power_tool(*spec) for spec in _POWER_TOOLS
+)
 
-@mcp.tool()
-async def restart_resource(vmid: str, node: str) -> str:
-    """Restart a VM or container"""
-    try:
-        result = await (await get_service()).restart_resource(vmid, node)
-        return f"🔄 Restart command sent to {vmid}: {result.get('message', 'Success')}"
-    except Exception as e:
-        logger.error(f"Error restarting {vmid}: {e}")
-        return f"❌ Error restarting {vmid}: {str(e)}"
+# Response templates for the snapshot commands
+_CREATE_SNAPSHOT_TMPL = "📸 Snapshot '{snapname}' created for {vmid}: {msg}"
+_DELETE_SNAPSHOT_TMPL = "🗑️ Snapshot '{snapname}' deleted from {vmid}: {msg}"
 
 @mcp.tool()
 async def create_snapshot(vmid: str, node: str, snapname: str, description: str = "") -> str:
     """Create a snapshot of a VM"""
     try:
-        result = await (await get_service()).create_snapshot(vmid, node, snapname, description)
-        return f"📸 Snapshot '{snapname}' created for {vmid}: {result.get('message', 'Success')}"
+        result = await (service or await get_service()).create_snapshot(vmid, node, snapname, description)
+        return _CREATE_SNAPSHOT_TMPL.format(snapname=snapname, vmid=vmid, msg=result.get('message', 'Success'))
     except Exception as e:
         logger.error(f"Error creating snapshot for {vmid}: {e}")
         return f"❌ Error creating snapshot for {vmid}: {str(e)}"
@@ -190,29 +261,33 @@ async def create_snapshot(vmid: str, node: str, snapname: str, description: str
 async def delete_snapshot(vmid: str, node: str, snapname: str) -> str:
     """Delete a snapshot of a VM"""
     try:
-        result = await (await get_service()).delete_snapshot(vmid, node, snapname)
-        return f"🗑️ Snapshot '{snapname}' deleted from {vmid}: {result.get('message', 'Success')}"
+        result = await (service or await get_service()).delete_snapshot(vmid, node, snapname)
+        return _DELETE_SNAPSHOT_TMPL.format(snapname=snapname, vmid=vmid, msg=result.get('message', 'Success'))
     except Exception as e:
         logger.error(f"Error deleting snapshot from {vmid}: {e}")
         return f"❌ Error deleting snapshot from {vmid}: {str(e)}"
 
-@mcp.tool()
+@mcp.tool(annotations=_READ_ONLY)
 async def get_snapshots(vmid: str, node: str) -> str:
     """List all snapshots for a VM"""
     try:
-        result = await (await get_service()).get_snapshots(vmid, node)
+        svc = service or await get_service()
+        result = await _inflight.do(("get_snapshots", vmid, node),
+                                    lambda: svc.get_snapshots(vmid, node))
         
         snapshots = result.get('snapshots', [])
         if not snapshots:
             return f"No snapshots found for {vmid}"
         
-        output = f"**Snapshots for {vmid}:**\n\n"
+        parts = [f"**Snapshots for {vmid}:**\n\n"]
         for snap in snapshots:
-            output += f"• **{snap['name']}**\n"
-            output += f"  - Description: {snap.get('description', 'No description')}\n"
-            output += f"  - Date: {snap.get('snaptime', 'Unknown')}\n\n"
+            parts.append(
+                f"• **{snap['name']}**\n"
+                f"  - Description: {snap.get('description', 'No description')}\n"
+                f"  - Date: {snap.get('snaptime', 'Unknown')}\n\n"
+            )
         
-        return output
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error getting snapshots for {vmid}: {e}")
         return f"❌ Error getting snapshots for {vmid}: {str(e)}"
@@ -221,9 +296,8 @@ async def get_snapshots(vmid: str, node: str) -> str:
 async def cluster_status() -> str:
     """Get Proxmox cluster status"""
     try:
-        result = await (await get_service()).get_cluster_status()
-        import json
-        return json.dumps(result, indent=2)
+        result = await _api_cache.get("cluster_status", (service or await get_service()).get_cluster_status)
+        return _dumps(result)
     except Exception as e:
         logger.error(f"Error getting cluster status: {e}")
         return f"Error getting cluster status: {str(e)}"
@@ -232,9 +306,8 @@ async def cluster_status() -> str:
 async def nodes_status() -> str:
     """Get Proxmox nodes status"""
     try:
-        result = await (await get_service()).get_nodes_status()
-        import json
-        return json.dumps(result, indent=2)
+        result = await _api_cache.get("nodes_status", (service or await get_service()).get_nodes_status)
+        return _dumps(result)
     except Exception as e:
         logger.error(f"Error getting nodes status: {e}")
         return f"Error getting nodes status: {str(e)}"
@@ -243,26 +316,14 @@ async def init_service():
     """Initialize Proxmox service with environment variables."""
     global service
     
-    proxmox_host = os.getenv('PROXMOX_HOST')
-    proxmox_user = os.getenv('PROXMOX_USER') 
-    proxmox_password = os.getenv('PROXMOX_PASSWORD')
-    
-    if not all([proxmox_host, proxmox_user, proxmox_password]):
+    if not all([PROXMOX_HOST, PROXMOX_USER, PROXMOX_PASSWORD]):
         logger.error("❌ Missing required environment variables:")
         logger.error("  PROXMOX_HOST, PROXMOX_USER, PROXMOX_PASSWORD")
         raise ValueError("Missing required environment variables")
     
     try:
-        # Run service initialization in thread pool to avoid blocking event loop
-        import asyncio
-        import concurrent.futures
-        
-        def create_service():
-            return ProxmoxService(proxmox_host, proxmox_user, proxmox_password)
-        
-        loop = asyncio.get_event_loop()
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            service = await loop.run_in_executor(executor, create_service)
+        # Connect on the default executor so the login doesn't block the event loop
+        service = await asyncio.to_thread(ProxmoxService, PROXMOX_HOST, PROXMOX_USER, PROXMOX_PASSWORD)
         
         logger.info("✅ Proxmox connection successful")
     except Exception as e:
@@ -279,8 +340,9 @@ async def create_vm(vmid: str, node: str, name: str, cores: int = 1, memory: int
     """Create a new VM"""
     try:
         iso = iso_image if iso_image else None
-        result = await (await get_service()).create_vm(vmid, node, name, cores, memory, disk_size, 
+        result = await (service or await get_service()).create_vm(vmid, node, name, cores, memory, disk_size, 
                                        storage, iso, os_type, start_after_create)
+        _invalidate("list_resources", "list_storage")
         
         if result.get('status') == 'pending':
             return f"🚀 VM {vmid} ({name}) creation initiated on {node}\n" \
@@ -300,8 +362,9 @@ async def create_container(vmid: str, node: str, hostname: str, cores: int = 1,
     try:
         tpl = template if template else None
         pwd = password if password else None
-        result = await (await get_service()).create_container(vmid, node, hostname, cores, memory, 
+        result = await (service or await get_service()).create_container(vmid, node, hostname, cores, memory, 
                                               rootfs_size, storage, tpl, pwd, unprivileged, start_after_create)
+        _invalidate("list_resources", "list_storage")
         
         if result.get('status') == 'pending':
             return f"📦 Container {vmid} ({hostname}) creation initiated on {node}\n" \
@@ -317,7 +380,8 @@ async def create_container(vmid: str, node: str, hostname: str, cores: int = 1,
 async def delete_resource(vmid: str, node: str, force: bool = False) -> str:
     """Delete a VM or container"""
     try:
-        result = await (await get_service()).delete_resource(vmid, node, force)
+        result = await (service or await get_service()).delete_resource(vmid, node, force)
+        _invalidate("list_resources", "list_storage", "list_templates")
         
         if result.get('status') == 'pending':
             force_text = " (forced)" if force else ""
@@ -339,10 +403,10 @@ async def resize_resource(vmid: str, node: str, cores: int = 0, memory: int = 0,
         memory_val = memory if memory > 0 else None
         disk_val = disk_size if disk_size else None
         
-        if not any([cores_val, memory_val, disk_val]):
+        if not (cores_val or memory_val or disk_val):
             return "❌ At least one resource parameter must be specified (cores > 0, memory > 0, or disk_size)"
         
-        result = await (await get_service()).resize_resource(vmid, node, cores_val, memory_val, disk_val)
+        result = await (service or await get_service()).resize_resource(vmid, node, cores_val, memory_val, disk_val)
         
         if result.get('status') == 'pending':
             changes = []
@@ -369,38 +433,46 @@ async def create_backup(vmid: str, node: str, storage: str = "", mode: str = "",
                        compress: str = "", notes: str = "") -> str:
     """Create a backup of a VM or container"""
     try:
-        result = await (await get_service()).create_backup(vmid, node, storage, mode, compress, notes)
+        result = await (service or await get_service()).create_backup(
+            vmid, node, storage=storage, compress=compress, mode=mode, notes=notes)
+        _invalidate("list_storage", "list_backups")
         
-        if result.get('status') == 'pending':
+        if result.get('status') == 'success':
             return f"💾 Backup initiated for {vmid} on {node}\n" \
-                   f"• Storage: {storage}\n• Mode: {mode}\n• Compression: {compress}\n" \
-                   f"• Notes: {notes or 'None'}\n• Task ID: {result.get('task_id')}"
+                   f"• Storage: {storage or 'Default'}\n• Mode: {mode or 'Default'}\n" \
+                   f"• Compression: {compress or 'Default'}\n" \
+                   f"• Notes: {notes or 'None'}\n• Task ID: {result.get('task')}"
         else:
             return f"❌ Error creating backup for {vmid}: {result.get('message')}"
     except Exception as e:
         logger.error(f"Error creating backup for {vmid}: {e}")
         return f"❌ Error creating backup for {vmid}: {str(e)}"
 
-@mcp.tool()
+@mcp.tool(annotations=_READ_ONLY)
 async def list_backups(node: str = "", storage: str = "") -> str:
     """List available backups"""
     try:
         node_val = node if node else None
         storage_val = storage if storage else None
-        result = await (await get_service()).list_backups(node_val, storage_val)
+        svc = service or await get_service()
+        result = await _api_cache.get(("list_backups", node_val, storage_val),
+                                      lambda: svc.list_backups(node_val, storage_val))
         
         backups = result.get('backups', [])
         if not backups:
             return "No backups found"
         
-        output = f"**Available Backups:**\n\n"
+        parts = ["**Available Backups:**\n\n"]
         for backup in backups:
-            output += f"• **{backup.get('volid', 'Unknown')}**\n"
-            output += f"  - Size: {backup.get('size', 'Unknown')}\n"
-            output += f"  - Format: {backup.get('format', 'Unknown')}\n"
-            output += f"  - Created: {backup.get('ctime', 'Unknown')}\n\n"
-        
-        return output
+            get = backup.get
+            parts.append(
+                f"• **{get('volid', 'Unknown')}**\n"
+                f"  - Size: {get('size', 'Unknown')}\n"
+                f"  - Format: {get('format', 'Unknown')}\n"
+                f"  - Created: {get('ctime', 'Unknown')}\n\n"
+            )
+        
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error listing backups: {e}")
         return f"❌ Error listing backups: {str(e)}"
@@ -410,26 +482,55 @@ async def restore_backup(archive: str, vmid: str, node: str, storage: str = "",
     """Restore a VM/container from backup"""
     try:
         storage_val = storage if storage else None
-        result = await (await get_service()).restore_backup(archive, vmid, node, storage_val, force)
+        result = await (service or await get_service()).restore_backup(archive, vmid, node, storage_val, force)
+        _invalidate("list_resources", "list_storage")
         
-        if result.get('status') == 'pending':
+        if result.get('status') == 'success':
             force_text = " (forced)" if force else ""
             return f"🔄 Restore{force_text} initiated for {vmid} on {node}\n" \
                    f"• Archive: {archive}\n• Storage: {storage or 'Default'}\n" \
-                   f"• Task ID: {result.get('task_id')}"
+                   f"• Task ID: {result.get('task')}"
         else:
             return f"❌ Error restoring {vmid}: {result.get('message')}"
     except Exception as e:
         logger.error(f"Error restoring {vmid}: {e}")
         return f"❌ Error restoring {vmid}: {str(e)}"
 
+@mcp.tool(annotations=_READ_ONLY)
+async def get_tasks_status(upids: str) -> str:
+    """Check several backup/restore tasks at once (comma-separated task UPIDs)"""
+    try:
+        upid_list = [upid.strip() for upid in upids.split(',') if upid.strip()]
+        if not upid_list:
+            return "❌ Error: at least one task UPID is required"
+        
+        result = await (service or await get_service()).get_tasks_status(upid_list)
+        
+        parts = ["**Task Status:**\n\n"]
+        for task in result.get('tasks', []):
+            get = task.get
+            line = f"• **{get('upid')}**\n  - Status: {get('status', 'unknown')}\n"
+            if get('exitstatus'):
+                line += f"  - Exit status: {get('exitstatus')}\n"
+            if get('kind'):
+                line += f"  - Operation: {get('kind')} of {get('vmid')} on {get('node')}\n"
+            if get('error'):
+                line += f"  - Error: {get('error')}\n"
+            parts.append(line + "\n")
+        
+        return "".join(parts)
+    except Exception as e:
+        logger.error(f"Error getting task status: {e}")
+        return f"❌ Error getting task status: {str(e)}"
+
 # === Template and Clone Tools ===
 
 @mcp.tool()
 async def create_template(vmid: str, node: str) -> str:
     """Convert a VM to a template"""
     try:
-        result = await (await get_service()).create_template(vmid, node)
+        result = await (service or await get_service()).create_template(vmid, node)
+        _invalidate("list_templates")
         
         if result.get('status') == 'pending':
             return f"📄 Template creation initiated for VM {vmid} on {node}\n" \
@@ -449,7 +550,8 @@ async def clone_vm(vmid: str, newid: str, node: str, name: str = "", target_node
         target_val = target_node if target_node else None
         storage_val = storage if storage else None
         
-        result = await (await get_service()).clone_vm(vmid, newid, node, name_val, target_val, full_clone, storage_val)
+        result = await (service or await get_service()).clone_vm(vmid, newid, node, name_val, target_val, full_clone, storage_val)
+        _invalidate("list_resources", "list_storage", "list_templates")
         
         if result.get('status') == 'pending':
             clone_type = "Full clone" if full_clone else "Linked clone"
@@ -462,44 +564,54 @@ async def clone_vm(vmid: str, newid: str, node: str, name: str = "", target_node
         logger.error(f"Error cloning {vmid}: {e}")
         return f"❌ Error cloning {vmid}: {str(e)}"
 
-@mcp.tool()
+@mcp.tool(annotations=_READ_ONLY)
 async def list_templates() -> str:
     """List all VM templates and LXC container templates in the cluster"""
     try:
-        result = await (await get_service()).list_templates()
+        result = await _api_cache.get("list_templates", (service or await get_service()).list_templates)
         
         templates = result.get('templates', [])
         if not templates:
             return "No templates found"
         
-        # Separate VM and LXC templates
-        vm_templates = [t for t in templates if t.get('type') == 'vm']
-        lxc_templates = [t for t in templates if t.get('type') == 'lxc']
+        # Separate VM and LXC templates in one pass
+        vm_templates, lxc_templates = [], []
+        for t in templates:
+            ttype = t.get('type')
+            if ttype == 'vm':
+                vm_templates.append(t)
+            elif ttype == 'lxc':
+                lxc_templates.append(t)
         
-        output = f"**Available Templates ({len(templates)} total):**\n\n"
+        parts = [f"**Available Templates ({len(templates)} total):**\n\n"]
         
         if vm_templates:
-            output += f"**VM Templates ({len(vm_templates)}):**\n"
+            parts.append(f"**VM Templates ({len(vm_templates)}):**\n")
             for template in vm_templates:
-                output += f"• **{template['name']}** (ID: {template['vmid']})\n"
-                output += f"  - Node: {template['node']}\n"
-                output += f"  - Type: VM Template\n"
-                output += f"  - Description: {template.get('description', 'None')}\n\n"
+                parts.append(
+                    f"• **{template['name']}** (ID: {template['vmid']})\n"
+                    f"  - Node: {template['node']}\n"
+                    f"  - Type: VM Template\n"
+                    f"  - Description: {template.get('description', 'None')}\n\n"
+                )
         
         if lxc_templates:
-            output += f"**LXC Container Templates ({len(lxc_templates)}):**\n"
+            parts.append(f"**LXC Container Templates ({len(lxc_templates)}):**\n")
             for template in lxc_templates:
+                get = template.get
                 # Format size
-                size_mb = template.get('size', 0) / (1024 * 1024)
-                output += f"• **{template['name']}**\n"
-                output += f"  - Node: {template['node']}\n"
-                output += f"  - Type: LXC Template\n"
-                output += f"  - Storage: {template.get('storage', 'Unknown')}\n"
-                output += f"  - Size: {size_mb:.1f} MB\n"
-                output += f"  - Volume ID: {template.get('volid', 'Unknown')}\n"
-                output += f"  - Description: {template.get('description', 'None')}\n\n"
-        
-        return output
+                size_mb = get('size', 0) / (1024 * 1024)
+                parts.append(
+                    f"• **{template['name']}**\n"
+                    f"  - Node: {template['node']}\n"
+                    f"  - Type: LXC Template\n"
+                    f"  - Storage: {get('storage', 'Unknown')}\n"
+                    f"  - Size: {size_mb:.1f} MB\n"
+                    f"  - Volume ID: {get('volid', 'Unknown')}\n"
+                    f"  - Description: {get('description', 'None')}\n\n"
+                )
+        
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error listing templates: {e}")
         return f"❌ Error listing templates: {str(e)}"
@@ -517,7 +629,8 @@ async def create_user(userid: str, password: str = "", email: str = "", firstnam
         last_val = lastname if lastname else None
         groups_list = groups.split(',') if groups else None
         
-        result = await (await get_service()).create_user(userid, pwd, email_val, first_val, last_val, groups_list, enable)
+        result = await (service or await get_service()).create_user(userid, pwd, email_val, first_val, last_val, groups_list, enable)
+        _invalidate("list_users")
         
         if result.get('status') == 'success':
             return f"👤 User created successfully: {userid}\n" \
@@ -533,7 +646,8 @@ async def create_user(userid: str, password: str = "", email: str = "", firstnam
 async def delete_user(userid: str) -> str:
     """Delete a Proxmox user"""
     try:
-        result = await (await get_service()).delete_user(userid)
+        result = await (service or await get_service()).delete_user(userid)
+        _invalidate("list_users", "list_permissions")
         
         if result.get('status') == 'success':
             return f"🗑️ User deleted successfully: {userid}"
@@ -543,24 +657,27 @@ async def delete_user(userid: str) -> str:
         logger.error(f"Error deleting user {userid}: {e}")
         return f"❌ Error deleting user {userid}: {str(e)}"
 
-@mcp.tool()
+@mcp.tool(annotations=_READ_ONLY)
 async def list_users() -> str:
     """List all Proxmox users"""
     try:
-        result = await (await get_service()).list_users()
+        result = await _api_cache.get("list_users", (service or await get_service()).list_users)
         
         users = result.get('users', [])
         if not users:
             return "No users found"
         
-        output = f"**Proxmox Users:**\n\n"
+        parts = ["**Proxmox Users:**\n\n"]
         for user in users:
-            output += f"• **{user.get('userid', 'Unknown')}**\n"
-            output += f"  - Enabled: {'Yes' if user.get('enable', 1) else 'No'}\n"
-            output += f"  - Email: {user.get('email', 'None')}\n"
-            output += f"  - Groups: {user.get('groups', 'None')}\n\n"
-        
-        return output
+            get = user.get
+            parts.append(
+                f"• **{get('userid', 'Unknown')}**\n"
+                f"  - Enabled: {'Yes' if get('enable', 1) else 'No'}\n"
+                f"  - Email: {get('email', 'None')}\n"
+                f"  - Groups: {get('groups', 'None')}\n\n"
+            )
+        
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error listing users: {e}")
         return f"❌ Error listing users: {str(e)}"
@@ -576,7 +693,8 @@ async def set_permissions(path: str, roleid: str, userid: str = "", groupid: str
         if not user_val and not group_val:
             return "❌ Either userid or groupid must be specified"
         
-        result = await (await get_service()).set_permissions(path, roleid, user_val, group_val, propagate)
+        result = await (service or await get_service()).set_permissions(path, roleid, user_val, group_val, propagate)
+        _invalidate("list_permissions")
         
         if result.get('status') == 'success':
             target = userid or groupid
@@ -588,48 +706,52 @@ async def set_permissions(path: str, roleid: str, userid: str = "", groupid: str
         logger.error(f"Error setting permissions: {e}")
         return f"❌ Error setting permissions: {str(e)}"
 
-@mcp.tool()
+@mcp.tool(annotations=_READ_ONLY)
 async def list_roles() -> str:
     """List all available Proxmox roles"""
     try:
-        result = await (await get_service()).list_roles()
+        result = await _api_cache.get("list_roles", (service or await get_service()).list_roles)
         
         roles = result.get('roles', [])
         if not roles:
             return "No roles found"
         
-        output = f"**Available Roles:**\n\n"
+        parts = ["**Available Roles:**\n\n"]
         for role in roles:
             role_name = role.get('roleid', 'Unknown')
-            output += f"• **{role_name}**\n"
-            if role.get('privs'):
-                output += f"  - Privileges: {role.get('privs')}\n"
-            output += "\n"
+            parts.append(f"• **{role_name}**\n")
+            privs = role.get('privs')
+            if privs:
+                parts.append(f"  - Privileges: {privs}\n")
+            parts.append("\n")
         
-        return output
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error listing roles: {e}")
         return f"❌ Error listing roles: {str(e)}"
 
-@mcp.tool()
+@mcp.tool(annotations=_READ_ONLY)
 async def list_permissions() -> str:
     """List all ACL permissions"""
     try:
-        result = await (await get_service()).list_permissions()
+        result = await _api_cache.get("list_permissions", (service or await get_service()).list_permissions)
         
         permissions = result.get('permissions', [])
         if not permissions:
             return "No permissions found"
         
-        output = f"**Current Permissions:**\n\n"
+        parts = ["**Current Permissions:**\n\n"]
         for perm in permissions:
-            output += f"• **Path:** {perm.get('path', 'Unknown')}\n"
-            output += f"  - Type: {perm.get('type', 'Unknown')}\n"
-            output += f"  - User/Group: {perm.get('ugid', 'Unknown')}\n"
-            output += f"  - Role: {perm.get('roleid', 'Unknown')}\n"
-            output += f"  - Propagate: {'Yes' if perm.get('propagate') else 'No'}\n\n"
-        
-        return output
+            get = perm.get
+            parts.append(
+                f"• **Path:** {get('path', 'Unknown')}\n"
+                f"  - Type: {get('type', 'Unknown')}\n"
+                f"  - User/Group: {get('ugid', 'Unknown')}\n"
+                f"  - Role: {get('roleid', 'Unknown')}\n"
+                f"  - Propagate: {'Yes' if get('propagate') else 'No'}\n\n"
+            )
+        
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error listing permissions: {e}")
         return f"❌ Error listing permissions: {str(e)}"
@@ -637,11 +759,12 @@ async def list_permissions() -> str:
 
 # === Storage Management Tools ===
 
-@mcp.tool()
+@mcp.tool(annotations=_READ_ONLY)
 async def list_storage(node: str = "") -> str:
     """List all available storage across nodes or specific node"""
     try:
-        result = await (await get_service()).list_storage(node)
+        svc = service or await get_service()
+        result = await _api_cache.get(("list_storage", node), lambda: svc.list_storage(node))
         storage_list = result.get('storage', [])
         
         if not storage_list:
@@ -650,12 +773,9 @@ async def list_storage(node: str = "") -> str:
         output = [f"💾 **Storage Overview** {f'(Node: {node})' if node else '(All Nodes)'}", ""]
         
         # Group by node
-        nodes = {}
+        nodes = defaultdict(list)
         for storage in storage_list:
-            node_name = storage['node']
-            if node_name not in nodes:
-                nodes[node_name] = []
-            nodes[node_name].append(storage)
+            nodes[storage['node']].append(storage)
         
         for node_name, storages in nodes.items():
             output.append(f"🖥️ **Node: {node_name}**")
@@ -690,11 +810,11 @@ async def list_storage(node: str = "") -> str:
         return f"❌ Error listing storage: {str(e)}"
 
 
-@mcp.tool()
+@mcp.tool(annotations=_READ_ONLY)
 async def get_storage_status(storage_name: str, node: str) -> str:
     """Get detailed status of a specific storage"""
     try:
-        result = await (await get_service()).get_storage_status(storage_name, node)
+        result = await (service or await get_service()).get_storage_status(storage_name, node)
         
         name = result['storage']
         storage_type = result['type']
@@ -751,11 +871,20 @@ async def get_storage_status(storage_name: str, node: str) -> str:
         return f"❌ Error getting storage status: {str(e)}"
 
 
-@mcp.tool()
+# Icons for storage content types
+_CONTENT_ICONS = {
+    'images': '💿',
+    'iso': '📀',
+    'vztmpl': '📦',
+    'backup': '💾',
+    'snippets': '📝'
+}
+
+@mcp.tool(annotations=_READ_ONLY)
 async def list_storage_content(storage_name: str, node: str, content_type: str = "") -> str:
     """List content in a specific storage"""
     try:
-        result = await (await get_service()).list_storage_content(storage_name, node, content_type)
+        result = await (service or await get_service()).list_storage_content(storage_name, node, content_type)
         content_list = result.get('content', [])
         
         if not content_list:
@@ -766,32 +895,19 @@ async def list_storage_content(storage_name: str, node: str, content_type: str =
         output = [f"📦 **Storage Content: {storage_name}**{filter_text} (Node: {node})", ""]
         
         # Group by content type
-        content_groups = {}
+        content_groups = defaultdict(list)
         for item in content_list:
-            ctype = item['content']
-            if ctype not in content_groups:
-                content_groups[ctype] = []
-            content_groups[ctype].append(item)
+            content_groups[item['content']].append(item)
         
         for ctype, items in content_groups.items():
-            icon = {
-                'images': '💿',
-                'iso': '📀',
-                'vztmpl': '📦',
-                'backup': '💾',
-                'snippets': '📝'
-            }.get(ctype, '📄')
+            icon = _CONTENT_ICONS.get(ctype, '📄')
             
             output.append(f"{icon} **{ctype.upper()}** ({len(items)} items)")
-            for item in items:
-                filename = item.get('filename', item['volid'])
-                size = item.get('size_human', '0 B')
-                vmid = item.get('vmid')
-                
-                if vmid:
-                    output.append(f"   📄 {filename} ({size}) - VM/CT: {vmid}")
-                else:
-                    output.append(f"   📄 {filename} ({size})")
+            output.extend(
+                f"   📄 {item.get('filename', item['volid'])} ({item.get('size_human', '0 B')})"
+                + (f" - VM/CT: {item['vmid']}" if item.get('vmid') else "")
+                for item in items
+            )
             output.append("")
         
         return "\n".join(output)
@@ -800,11 +916,18 @@ async def list_storage_content(storage_name: str, node: str, content_type: str =
         return f"❌ Error listing storage content: {str(e)}"
 
 
-@mcp.tool()
+# Recommendation text by usage band: (usage below this percent, text)
+_REC_BANDS = (
+    (80, "✅ Good choice"),
+    (90, "⚠️ Nearly full"),
+)
+_REC_FULL = "🔴 Almost no space"
+
+@mcp.tool(annotations=_READ_ONLY)
 async def get_suitable_storage(node: str, content_type: str, min_free_gb: float = 0) -> str:
     """Find storage suitable for specific content type with optional minimum free space"""
     try:
-        result = await (await get_service()).get_suitable_storage(node, content_type, min_free_gb)
+        result = await (service or await get_service()).get_suitable_storage(node, content_type, min_free_gb)
         suitable_storage = result.get('suitable_storage', [])
         
         if not suitable_storage:
@@ -824,74 +947,184 @@ async def get_suitable_storage(node: str, content_type: str, min_free_gb: float
             # Recommendation based on available space and usage
             if i == 1:
                 rec = "🌟 **RECOMMENDED**"
-            elif usage < 80:
-                rec = "✅ Good choice"
-            elif usage < 90:
-                rec = "⚠️ Nearly full"
             else:
-                rec = "🔴 Almost no space"
+                rec = next((text for limit, text in _REC_BANDS if usage < limit), _REC_FULL)
             
-            output.append(f"{i}. **{name}** ({storage_type}) {shared}")
-            output.append(f"   💾 Available: {avail:.1f}GB (Usage: {usage:.1f}%)")
-            output.append(f"   {rec}")
-            output.append("")
+            # One entry per storage; the trailing newline gives the blank separator line
+            output.append(
+                f"{i}. **{name}** ({storage_type}) {shared}\n"
+                f"   💾 Available: {avail:.1f}GB (Usage: {usage:.1f}%)\n"
+                f"   {rec}\n"
+            )
         
         return "\n".join(output)
     except Exception as e:
         logger.error(f"Error finding suitable storage: {e}")
         return f"❌ Error finding suitable storage: {str(e)}"
 
-if __name__ == "__main__":
-    import sys
-    import asyncio
+# === Batch Execution ===
+
+# Tools that batch_execute may dispatch to
+_BATCH_TOOLS = frozenset(
+    fn.__name__ for fn in (
+        list_resources, get_resource_status, start_resource, stop_resource,
+        shutdown_resource, restart_resource, create_snapshot, delete_snapshot,
+        get_snapshots, create_vm, create_container, delete_resource, resize_resource,
+        create_backup, list_backups, restore_backup, get_tasks_status, create_template,
+        clone_vm, list_templates, create_user, delete_user, list_users, set_permissions,
+        list_roles, list_permissions, list_storage, get_storage_status,
+        list_storage_content, get_suitable_storage,
+    )
+)
+
+# The batchable tools that only read; every other one changes cluster state
+_BATCH_READ_ONLY = frozenset(
+    fn.__name__ for fn in (
+        list_resources, get_resource_status, get_snapshots, list_backups,
+        get_tasks_status, list_templates, list_users, list_roles, list_permissions,
+        list_storage, get_storage_status, list_storage_content, get_suitable_storage,
+    )
+)
+
+@mcp.tool()
+async def batch_execute(ops: list[dict], max_concurrent: int = 8, stop_on_error: bool = False) -> str:
+    """Run several tools in one call. Each op is {"tool": name, "args": {...}}; returns JSON results in op order. Consecutive read-only ops run concurrently; an op that changes state runs alone, after every op listed before it. "ok" is false when the call itself failed (unknown tool, invalid args)"""
+    async def run(op):
+        name = op.get("tool")
+        if name not in _BATCH_TOOLS:
+            return {"tool": name, "ok": False, "result": f"❌ Unknown tool: {name}"}
+        try:
+            # Same validation and coercion as a direct tools/call (e.g. "1024" -> 1024)
+            content = await mcp.call_tool(name, op.get("args", {}))
+        except Exception as e:
+            return {"tool": name, "ok": False, "result": f"❌ Error executing {name}: {str(e)}"}
+        if isinstance(content, tuple):
+            # Newer SDKs return (content blocks, structured output)
+            content = content[0]
+        return {"tool": name, "ok": True, "result": "".join(getattr(block, "text", "") for block in content)}
     
-    # Parse command line arguments
-    mount_path = None
+    results = []
+    if stop_on_error:
+        # Run in order and stop at the first failure
+        for op in ops:
+            results.append(await run(op))
+            if not results[-1]["ok"]:
+                break
+    else:
+        sem = asyncio.Semaphore(max(1, max_concurrent))
+        
+        async def bounded(op):
+            async with sem:
+                return await run(op)
+        
+        # Reads listed after a state change must observe it, so only runs of
+        # consecutive read-only ops overlap
+        for read_only, group in groupby(ops, key=lambda op: op.get("tool") in _BATCH_READ_ONLY):
+            if read_only:
+                results.extend(await asyncio.gather(*(bounded(op) for op in group)))
+            else:
+                for op in group:
+                    results.append(await run(op))
     
-    i = 1
-    while i < len(sys.argv):
-        if sys.argv[i] == "--mount-path" and i + 1 < len(sys.argv):
-            mount_path = sys.argv[i + 1]
-            i += 2
-        elif sys.argv[i] in ["--help", "-h"]:
-            print("Proxmox MCP Server - SSE Transport")
-            print("Usage: python mcp_server.py [--mount-path PATH]")
-            print()
-            print("Options:")
-            print("  --mount-path PATH  SSE mount path (optional)")
-            print("  --help, -h         Show this help message")
-            print()
-            print("Environment variables required:")
-            print("  PROXMOX_HOST       Proxmox VE host")
-            print("  PROXMOX_USER       Proxmox VE username")
-            print("  PROXMOX_PASSWORD   Proxmox VE password")
-            print()
-            print("Environment variables optional:")
-            print(f"  MCP_PORT          Server port (default: {DEFAULT_MCP_PORT})")
-            print(f"  MCP_HOST          Server host (default: {DEFAULT_MCP_HOST})")
-            sys.exit(0)
-        else:
-            print(f"Unknown argument: {sys.argv[i]}")
-            sys.exit(1)
+    return json.dumps(results, indent=2, ensure_ascii=False)
+
+class NoBufferingMiddleware:
+    """ASGI middleware asking reverse proxies not to buffer or rewrite streamed responses."""
+    
+    def __init__(self, app):
+        self.app = app
     
-    # Get port from environment or use default
-    from src.config import DEFAULT_MCP_PORT, DEFAULT_MCP_HOST
-    port = os.getenv("MCP_PORT", str(DEFAULT_MCP_PORT))
-    host = os.getenv("MCP_HOST", DEFAULT_MCP_HOST)
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_header(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                # sse-starlette already sets it on the event stream
+                if not any(k == b"x-accel-buffering" for k, _ in headers):
+                    headers.append((b"x-accel-buffering", b"no"))
+                if any(k == b"content-type" and v.startswith(b"text/event-stream") for k, v in headers):
+                    # no-transform keeps proxies from compressing (and so batching) events
+                    cache_control = [v for k, v in headers if k == b"cache-control"]
+                    headers = [(k, v) for k, v in headers if k != b"cache-control"]
+                    headers.append((b"cache-control", b", ".join([*cache_control, b"no-transform"])))
+                message["headers"] = headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_header)
+
+class SSEAdmissionMiddleware:
+    """ASGI middleware capping concurrent SSE streams, rejecting extras with 503."""
+    
+    def __init__(self, app, limit: int, sse_path: str):
+        self.app = app
+        self.sse_path = sse_path
+        self._slots = asyncio.Semaphore(limit)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].endswith(self.sse_path):
+            await self.app(scope, receive, send)
+            return
+        
+        if self._slots.locked():
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [(b"content-type", b"text/plain"), (b"retry-after", b"5")],
+            })
+            await send({"type": "http.response.body", "body": b"Too many SSE connections"})
+            return
+        
+        async with self._slots:
+            await self.app(scope, receive, send)
+
+async def bootstrap(mount_path: str = None):
+    """Serve SSE immediately while the Proxmox service connects in the background."""
+    async def warm_up():
+        # get_service holds the init lock, so early tool calls wait for this
+        try:
+            await get_service()
+            logger.info("✅ Service pre-initialized successfully")
+        except Exception as e:
+            logger.error(f"❌ Service initialization failed: {e}")
+            logger.error("The server will start but tools may not work until service initializes")
+    
+    app = mcp.sse_app(mount_path)
+    app.add_middleware(NoBufferingMiddleware)
+    app.add_middleware(SSEAdmissionMiddleware, limit=MCP_MAX_SSE_CONNECTIONS,
+                       sse_path=mcp.settings.sse_path)
+    server = uvicorn.Server(uvicorn.Config(app, host=MCP_HOST, port=MCP_PORT, log_level="info"))
     
-    logger.info(f"🚀 Starting Proxmox MCP Server on {host}:{port}")
+    warm_up_task = asyncio.create_task(warm_up())
+    try:
+        await server.serve()
+    finally:
+        warm_up_task.cancel()
+        logger.info(f"📊 API cache: {_api_cache.hits} hits, {_api_cache.misses} misses, "
+                    f"{_api_cache.revalidations} background refreshes")
+        if service is not None:
+            service.close()
+            logger.info("🔽 Closed Proxmox connection")
+
+if __name__ == "__main__":
+    # Parse command line arguments
+    args = _parser.parse_args()
+    if args.help:
+        sys.stdout.write(_HELP)
+        sys.exit(0)
+    mount_path = args.mount_path
+    
+    logger.info(f"🚀 Starting Proxmox MCP Server on {MCP_HOST}:{MCP_PORT}")
     logger.info("💡 Set MCP_PORT and MCP_HOST environment variables to customize")
     
-    # Pre-initialize service to avoid MCP protocol race condition
-    logger.info("🔄 Initializing Proxmox service...")
+    # Prefer uvloop's event loop; fall back to asyncio's where it isn't available
     try:
-        # Use asyncio to pre-initialize the service
-        import asyncio
-        asyncio.run(init_service())
-        logger.info("✅ Service pre-initialized successfully")
-    except Exception as e:
-        logger.error(f"❌ Service initialization failed: {e}")
-        logger.error("The server will start but tools may not work until service initializes")
+        import uvloop
+        run = uvloop.run  # added in uvloop 0.18
+    except (ImportError, AttributeError):
+        run = asyncio.run
     
-    # Run the SSE server
-    mcp.run(transport="sse", mount_path=mount_path) 
\ No newline at end of file
+    # Run the SSE server and the Proxmox connection on one event loop
+    run(bootstrap(mount_path)) 
\ No newline at end of file
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Compile .env into _env_cache.py so the server can import it instead of parsing .env at startup.
+
+Usage: python scripts/compile_env.py [ENV_FILE]
+"""
+
+import os
+import sys
+from dotenv import dotenv_values
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main():
+    env_file = sys.argv[1] if len(sys.argv) > 1 else os.path.join(ROOT, '.env')
+    if not os.path.exists(env_file):
+        print(f"❌ {env_file} not found")
+        sys.exit(1)
+    
+    env = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+    target = os.path.join(ROOT, '_env_cache.py')
+    with open(target, 'w') as f:
+        f.write(f'"""Generated from {os.path.basename(env_file)} by scripts/compile_env.py - do not edit."""\n')
+        f.write(f"ENV = {env!r}\n")
+    
+    print(f"✅ Wrote {len(env)} variables to {target}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""
+Proxmox VE service layer for the MCP server.
+"""
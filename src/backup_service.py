@@ -1,16 +1,33 @@
 """
 Backup and restore service.
 """
+import asyncio
 import logging
+import time
 from typing import Dict, Any, List
 from .base_service import BaseProxmoxService
 from .config import DEFAULT_BACKUP_COMPRESSION, DEFAULT_BACKUP_MODE, DEFAULT_BACKUP_STORAGE
 
 logger = logging.getLogger(__name__)
 
+# How many started backup/restore tasks to remember for status polling
+_RECENT_TASKS_MAX = 100
+
 class BackupService(BaseProxmoxService):
     """Service for backup and restore operations."""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # UPID -> {node, kind, vmid, started} for tasks started by this service
+        self._recent_tasks: Dict[str, Dict[str, Any]] = {}
+    
+    def _remember_task(self, upid: str, node: str, kind: str, vmid: str):
+        """Record a started task so get_tasks_status can poll it."""
+        self._recent_tasks[upid] = {'node': node, 'kind': kind, 'vmid': vmid, 'started': time.time()}
+        if len(self._recent_tasks) > _RECENT_TASKS_MAX:
+            # Dicts keep insertion order, so the first key is the oldest task
+            del self._recent_tasks[next(iter(self._recent_tasks))]
+    
     def create_backup(self, vmid: str, node: str, storage: str = "",
                      compress: str = "", mode: str = "",
                      notes: str = "") -> Dict[str, Any]:
@@ -32,6 +49,7 @@ class BackupService(BaseProxmoxService):
                 config['notes'] = notes
             
             task = self.proxmox.nodes(node).vzdump.create(**config)
+            self._remember_task(task, node, 'backup', vmid)
             
             return {
                 "status": "success", 
@@ -43,47 +61,50 @@ class BackupService(BaseProxmoxService):
             logger.error(f"Failed to create backup for {vmid}: {e}")
             raise
     
-    def list_backups(self, node: str = "", storage: str = "") -> List[Dict[str, Any]]:
-        """List available backups."""
+    def _storage_backups(self, node_name: str, storage_name: str) -> List[Dict[str, Any]]:
+        """Backups stored on one storage of a node."""
+        storage_backups = self.proxmox.nodes(node_name).storage(storage_name).content.get(content='backup')
+        return [{
+            'node': node_name,
+            'storage': storage_name,
+            'volid': backup['volid'],
+            'size': backup.get('size', 0),
+            'format': backup.get('format', 'unknown'),
+            'ctime': backup.get('ctime', 0)
+        } for backup in storage_backups]
+    
+    async def list_backups(self, node: str = "", storage: str = "") -> List[Dict[str, Any]]:
+        """List available backups, querying every matching storage concurrently."""
         try:
-            backups = []
-            
-            # If specific node provided, check only that node
-            if node:
-                nodes_to_check = [node]
-            else:
-                # Get all nodes
-                nodes_list = self.proxmox.nodes.get()
-                nodes_to_check = [n['node'] for n in nodes_list]
-            
-            for node_name in nodes_to_check:
+            if node and storage:
+                # Exactly one storage to read; no need to list the cluster's storages
                 try:
-                    # Get storage list for this node
-                    if storage:
-                        storages_to_check = [storage]
-                    else:
-                        storages = self.proxmox.nodes(node_name).storage.get()
-                        storages_to_check = [s['storage'] for s in storages if s.get('content', '').find('backup') >= 0]
-                    
-                    for storage_name in storages_to_check:
-                        try:
-                            storage_backups = self.proxmox.nodes(node_name).storage(storage_name).content.get(content='backup')
-                            for backup in storage_backups:
-                                backups.append({
-                                    'node': node_name,
-                                    'storage': storage_name,
-                                    'volid': backup['volid'],
-                                    'size': backup.get('size', 0),
-                                    'format': backup.get('format', 'unknown'),
-                                    'ctime': backup.get('ctime', 0)
-                                })
-                        except Exception:
-                            # Storage might not support backups or be unavailable
-                            continue
-                            
+                    return await asyncio.to_thread(self._storage_backups, node, storage)
                 except Exception:
-                    # Node might be unavailable
-                    continue
+                    # Storage might not support backups or be unavailable
+                    return []
+            
+            # One cluster-wide query lists every (node, storage) pair, instead of
+            # listing the nodes and then each node's storages
+            rows = await asyncio.to_thread(
+                self._cached, "storage:cluster", lambda: self.proxmox.cluster.resources.get(type='storage'))
+            targets = [(row['node'], row['storage']) for row in rows
+                       if (not node or row['node'] == node)
+                       and (row['storage'] == storage if storage else 'backup' in row.get('content', ''))
+                       # Storages on offline nodes report status 'unknown'
+                       and row.get('status', 'available') == 'available']
+            
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self._storage_backups, node_name, storage_name)
+                  for node_name, storage_name in targets),
+                return_exceptions=True
+            )
+            
+            backups = []
+            for result in results:
+                # Storage might not support backups or be unavailable
+                if not isinstance(result, Exception):
+                    backups.extend(result)
             
             return backups
             
@@ -112,6 +133,8 @@ class BackupService(BaseProxmoxService):
             else:
                 task = self.proxmox.nodes(node).lxc.create(**config)
             
+            self._remember_task(task, node, 'restore', vmid)
+            
             return {
                 "status": "success",
                 "message": f"Restore of {vmid} from {archive} initiated",
@@ -120,4 +143,34 @@ class BackupService(BaseProxmoxService):
             
         except Exception as e:
             logger.error(f"Failed to restore backup {archive}: {e}")
-            raise 
\ No newline at end of file
+            raise
+    
+    def _task_status(self, upid: str) -> Dict[str, Any]:
+        """Status of one task, with the metadata recorded when it was started."""
+        meta = self._recent_tasks.get(upid, {})
+        # UPIDs look like UPID:<node>:..., so tasks started elsewhere can be polled too
+        node = meta.get('node') or upid.split(':')[1]
+        status = self.proxmox.nodes(node).tasks(upid).status.get()
+        return {
+            **meta,
+            'upid': upid,
+            'node': node,
+            'status': status.get('status', 'unknown'),
+            'exitstatus': status.get('exitstatus', '')
+        }
+    
+    async def get_tasks_status(self, upids: List[str]) -> List[Dict[str, Any]]:
+        """Poll several tasks at once, querying them concurrently."""
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._task_status, upid) for upid in upids),
+            return_exceptions=True
+        )
+        
+        statuses = []
+        for upid, result in zip(upids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to get status for task {upid}: {result}")
+                result = {'upid': upid, 'status': 'unknown', 'error': str(result)}
+            statuses.append(result)
+        
+        return statuses
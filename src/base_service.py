@@ -1,12 +1,30 @@
 """
 Base Proxmox service with core connection functionality.
 """
+import asyncio
 import logging
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, Callable, List, Optional, Tuple, TypedDict
 from proxmoxer import ProxmoxAPI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .config import PROXMOX_CACHE_TTL, PROXMOX_POOL_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Guest kinds per node, and the name prefix used when a guest has no name
+_GUEST_KINDS = ('qemu', 'lxc')
+_NAME_PREFIX = {'qemu': 'VM', 'lxc': 'CT'}
+
+class ResourceRecord(TypedDict):
+    """One VM or container as returned by list_resources."""
+    vmid: int
+    name: str
+    status: str
+    node: str
+    type: str  # 'qemu' or 'lxc'
+    uptime: int
+
 class BaseProxmoxService:
     """Base service class for Proxmox operations with core connection functionality."""
     
@@ -27,6 +45,31 @@ class BaseProxmoxService:
             self.verify_ssl = verify_ssl
             self.proxmox = None
             self.connect()
+        
+        # proxmoxer fixes the base URL and auth once per connection; keep the
+        # /nodes resource too instead of rebuilding it on every API call
+        self._nodes = self.proxmox.nodes
+        
+        # Short-lived cache for cluster topology (node and storage lists)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+    
+    def _cached(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Return fn()'s result, reusing it for PROXMOX_CACHE_TTL seconds."""
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < PROXMOX_CACHE_TTL:
+            return entry[1]
+        value = fn()
+        self._cache[key] = (time.monotonic(), value)
+        return value
+    
+    def invalidate_cache(self, prefix: str = ""):
+        """Drop cached topology entries whose key starts with prefix (all by default)."""
+        for key in [k for k in self._cache if k.startswith(prefix)]:
+            self._cache.pop(key, None)
+    
+    def _get_nodes(self) -> List[Dict[str, Any]]:
+        """List the cluster nodes (cached)."""
+        return self._cached("nodes", self._nodes.get)
     
     def connect(self):
         """Establish connection to Proxmox VE."""
@@ -38,6 +81,15 @@ class BaseProxmoxService:
                 verify_ssl=self.verify_ssl
             )
             
+            # Size the keep-alive pool for concurrent tool calls sharing this connection;
+            # Retry's defaults only repeat idempotent methods, so POSTs are never resent
+            session = self.proxmox._store["session"]
+            session.mount("https://", HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=PROXMOX_POOL_SIZE,
+                max_retries=Retry(total=2, backoff_factor=0.1)
+            ))
+            
             # Test connection
             version = self.proxmox.version.get()
             logger.info(f"Successfully connected to Proxmox VE {version['version']}")
@@ -46,57 +98,113 @@ class BaseProxmoxService:
             logger.error(f"Failed to connect to Proxmox: {e}")
             raise
     
-    def list_resources(self) -> List[Dict[str, Any]]:
+    def close(self):
+        """Close the pooled HTTP session behind the Proxmox connection."""
+        # proxmoxer keeps one keep-alive requests.Session for every API call
+        session = getattr(self.proxmox, "_store", {}).get("session")
+        if session is not None:
+            session.close()
+    
+    def _node_guests(self, node_name: str, kind: str) -> List[ResourceRecord]:
+        """List the VMs (kind 'qemu') or containers (kind 'lxc') on one node."""
+        prefix = _NAME_PREFIX[kind]
+        return [{
+            'vmid': guest['vmid'],
+            'name': guest.get('name', f"{prefix}-{guest['vmid']}"),
+            'status': guest['status'],
+            'node': node_name,
+            'type': kind,
+            'uptime': guest.get('uptime', 0)
+        } for guest in getattr(self._nodes(node_name), kind).get()]
+    
+    def _cluster_vm_rows(self, fresh: bool = False) -> List[Dict[str, Any]]:
+        """Raw cluster/resources rows for every VM and container (cached unless fresh)."""
+        if fresh:
+            # Listings are cached by the caller; refetch but leave the rows for type lookups
+            self._cache.pop("guests", None)
+        return self._cached("guests", lambda: self.proxmox.cluster.resources.get(type='vm'))
+    
+    def _cluster_guests(self) -> List[ResourceRecord]:
+        """List every VM and container in the cluster with one cluster/resources call."""
+        return [{
+            'vmid': row['vmid'],
+            'name': row.get('name', f"{_NAME_PREFIX[row['type']]}-{row['vmid']}"),
+            'status': row['status'],
+            'node': row['node'],
+            'type': row['type'],
+            'uptime': row.get('uptime', 0)
+        } for row in self._cluster_vm_rows(fresh=True)]
+    
+    def list_resources(self) -> List[ResourceRecord]:
         """List all VMs and containers."""
         try:
-            resources = []
+            try:
+                return self._cluster_guests()
+            except Exception as e:
+                # Older PVE releases: fall back to walking the nodes
+                logger.debug(f"cluster/resources unavailable, listing per node: {e}")
             
-            # Get all nodes
-            nodes = self.proxmox.nodes.get()
+            resources = []
+            for node in self._get_nodes():
+                for kind in _GUEST_KINDS:
+                    resources.extend(self._node_guests(node['node'], kind))
+            return resources
             
-            for node in nodes:
-                node_name = node['node']
-                
-                # Get VMs (QEMU)
-                vms = self.proxmox.nodes(node_name).qemu.get()
-                for vm in vms:
-                    resources.append({
-                        'vmid': vm['vmid'],
-                        'name': vm.get('name', f"VM-{vm['vmid']}"),
-                        'status': vm['status'],
-                        'node': node_name,
-                        'type': 'qemu',
-                        'uptime': vm.get('uptime', 0)
-                    })
-                
-                # Get Containers (LXC)
-                containers = self.proxmox.nodes(node_name).lxc.get()
-                for container in containers:
-                    resources.append({
-                        'vmid': container['vmid'],
-                        'name': container.get('name', f"CT-{container['vmid']}"),
-                        'status': container['status'],
-                        'node': node_name,
-                        'type': 'lxc',
-                        'uptime': container.get('uptime', 0)
-                    })
+        except Exception as e:
+            logger.error(f"Failed to list resources: {e}")
+            raise
+    
+    async def list_resources_async(self) -> List[ResourceRecord]:
+        """List all VMs and containers, querying every node concurrently if needed."""
+        try:
+            try:
+                return await asyncio.to_thread(self._cluster_guests)
+            except Exception as e:
+                # Older PVE releases: fall back to walking the nodes
+                logger.debug(f"cluster/resources unavailable, listing per node: {e}")
             
-            return resources
+            nodes = await asyncio.to_thread(self._get_nodes)
+            batches = await asyncio.gather(*(
+                asyncio.to_thread(self._node_guests, node['node'], kind)
+                for node in nodes for kind in _GUEST_KINDS
+            ))
+            return [resource for batch in batches for resource in batch]
             
         except Exception as e:
             logger.error(f"Failed to list resources: {e}")
             raise
     
-    def get_resource_status(self, vmid: str, node: str) -> Dict[str, Any]:
-        """Get detailed status of a VM or container."""
+    def _guest_type(self, vmid: str, node: str) -> Optional[str]:
+        """Look up whether vmid on node is 'qemu' or 'lxc' from the cached cluster resources."""
+        for row in self._cluster_vm_rows():
+            if str(row.get('vmid')) == str(vmid) and row.get('node') == node:
+                return row.get('type')
+        return None
+    
+    def get_resource_status(self, vmid: str, node: str, vm_type: str = "") -> Dict[str, Any]:
+        """Get detailed status of a VM or container (vm_type 'qemu' or 'lxc' skips the lookup)."""
         try:
+            kind = vm_type
+            if not kind:
+                try:
+                    kind = self._guest_type(vmid, node)
+                except Exception as e:
+                    logger.debug(f"Could not look up type of {vmid}: {e}")
+            
+            if kind in _GUEST_KINDS:
+                try:
+                    return getattr(self._nodes(node), kind)(vmid).status.current.get()
+                except Exception:
+                    # Cached type may be stale (guest recreated); probe both below
+                    pass
+            
             # Try to get as VM first
             try:
-                status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
+                status = self._nodes(node).qemu(vmid).status.current.get()
                 return status
             except:
                 # If failed, try as container
-                status = self.proxmox.nodes(node).lxc(vmid).status.current.get()
+                status = self._nodes(node).lxc(vmid).status.current.get()
                 return status
                 
         except Exception as e:
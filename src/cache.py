@@ -0,0 +1,124 @@
+"""
+Small in-process caches for Proxmox API results.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class AsyncTTLCache:
+    """Async TTL cache that coalesces concurrent misses for the same key.
+
+    Entries younger than ttl are served as-is. Entries up to stale_ttl seconds
+    past that are still served, while one background task refreshes them.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128, stale_ttl: float = 0):
+        """Cache values for ttl seconds, keeping at most maxsize keys (least recently used go first)."""
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def _lookup(self, key: Hashable, max_age: float) -> Optional[Tuple[float, Any]]:
+        entry = self._data.get(key)
+        if entry is not None and time.monotonic() - entry[0] < max_age:
+            self._data.move_to_end(key)
+            return entry
+        return None
+
+    def _store(self, key: Hashable, value: Any):
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            evicted, _ = self._data.popitem(last=False)
+            stale_lock = self._locks.get(evicted)
+            if stale_lock is not None and not stale_lock.locked():
+                del self._locks[evicted]
+
+    async def _revalidate(self, key: Hashable, fn: Callable[[], Awaitable[Any]]):
+        try:
+            self._store(key, await fn())
+        except Exception:
+            # Keep serving the stale entry; the next caller after it expires refetches
+            pass
+        finally:
+            if self._refreshing.get(key) is asyncio.current_task():
+                del self._refreshing[key]
+
+    async def get(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, awaiting fn() to refresh it when stale."""
+        entry = self._lookup(key, self.ttl + self.stale_ttl)
+        if entry is not None:
+            if time.monotonic() - entry[0] >= self.ttl and key not in self._refreshing:
+                self.revalidations += 1
+                self._refreshing[key] = asyncio.create_task(self._revalidate(key, fn))
+            self.hits += 1
+            return entry[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another caller may have refreshed the entry while we waited
+                entry = self._lookup(key, self.ttl)
+                if entry is not None:
+                    self.hits += 1
+                    return entry[1]
+
+                self.misses += 1
+                value = await fn()
+                self._store(key, value)
+                return value
+        finally:
+            # A failed fetch stores nothing, so eviction would never drop its lock
+            if key not in self._data and self._locks.get(key) is lock and not lock.locked():
+                del self._locks[key]
+
+    def _drop(self, key: Hashable):
+        self._data.pop(key, None)
+        task = self._refreshing.pop(key, None)
+        if task is not None:
+            # A refresh started before the change would write the old state back
+            task.cancel()
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one cached key, or everything when key is None."""
+        keys = list(self._data) + list(self._refreshing) if key is None else [key]
+        for k in keys:
+            self._drop(k)
+
+    def invalidate_prefix(self, name: str):
+        """Drop name and every (name, ...) tuple key."""
+        for key in [k for k in (*self._data, *self._refreshing)
+                    if k == name or (isinstance(k, tuple) and k and k[0] == name)]:
+            self._drop(key)
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers asking for the same key."""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def _finished(self, key: Hashable, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved when every caller had given up
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn() once per key; callers arriving meanwhile get the same result."""
+        task = self._inflight.get(key)
+        if task is None:
+            # fn runs as its own task, so even the first caller being cancelled
+            # leaves it running for everyone else
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        return await asyncio.shield(task)
@@ -7,6 +7,26 @@ import os
 DEFAULT_MCP_HOST = "0.0.0.0"
 DEFAULT_MCP_PORT = 8001
 
+# Environment snapshot, read once at import (callers load .env first)
+MCP_HOST = os.getenv("MCP_HOST", DEFAULT_MCP_HOST)
+MCP_PORT = int(os.getenv("MCP_PORT", str(DEFAULT_MCP_PORT)))
+PROXMOX_HOST = os.getenv("PROXMOX_HOST")
+PROXMOX_USER = os.getenv("PROXMOX_USER")
+PROXMOX_PASSWORD = os.getenv("PROXMOX_PASSWORD")
+
+# Maximum concurrent SSE streams; further connections get 503 until one closes
+MCP_MAX_SSE_CONNECTIONS = int(os.getenv("MCP_MAX_SSE_CONNECTIONS", "64"))
+
+# Keep-alive HTTPS connections held open to the Proxmox API
+PROXMOX_POOL_SIZE = int(os.getenv("PROXMOX_POOL_SIZE", "10"))
+
+# Seconds that read-heavy listings (resources, storage, templates, status) stay cached
+PROXMOX_CACHE_TTL = float(os.getenv("PROXMOX_CACHE_TTL", "5"))
+# Extra seconds an expired listing may still be served while it refreshes in the background.
+# Off by default: with it on, a client polling slower than the TTL always sees the data
+# fetched on its previous poll, e.g. a VM still missing after create_vm's task finished
+PROXMOX_CACHE_STALE_TTL = float(os.getenv("PROXMOX_CACHE_STALE_TTL", "0"))
+
 # Proxmox VM/Container Defaults
 DEFAULT_VM_CORES = 1
 DEFAULT_VM_MEMORY = 512  # MB
@@ -20,7 +20,7 @@ class StorageService(BaseProxmoxService):
                 nodes_to_check = [node]
             else:
                 # Get all nodes
-                nodes_list = self.proxmox.nodes.get()
+                nodes_list = self._get_nodes()
                 nodes_to_check = [n['node'] for n in nodes_list]
             
             for node_name in nodes_to_check:
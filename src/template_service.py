@@ -61,7 +61,7 @@ class TemplateService(BaseProxmoxService):
             templates = []
             
             # Get all nodes
-            nodes = self.proxmox.nodes.get()
+            nodes = self._get_nodes()
             
             for node in nodes:
                 node_name = node['node']
@@ -80,7 +80,7 @@ class TemplateService(BaseProxmoxService):
                 
                 # Get LXC container templates from storage
                 try:
-                    storages = self.proxmox.nodes(node_name).storage.get()
+                    storages = self._cached(f"storage:{node_name}", self.proxmox.nodes(node_name).storage.get)
                     for storage in storages:
                         storage_name = storage['storage']
                         try:
@@ -1,6 +1,7 @@
 """
 Unified Proxmox service combining all domain-specific services.
 """
+import asyncio
 import logging
 from typing import Dict, Any, List
 from .base_service import BaseProxmoxService
@@ -42,12 +43,13 @@ class ProxmoxService(BaseProxmoxService):
     # Core functionality - async wrappers
     async def list_resources(self) -> Dict[str, Any]:
         """List all VMs and containers."""
-        resources = super().list_resources()
+        resources = await self.list_resources_async()
         return {'resources': resources}
     
-    async def get_resource_status(self, vmid: str, node: str) -> Dict[str, Any]:
+    async def get_resource_status(self, vmid: str, node: str, vm_type: str = "") -> Dict[str, Any]:
         """Get detailed status of a VM or container."""
-        return super().get_resource_status(vmid, node)
+        # Off the event loop, so concurrent identical lookups can be coalesced meanwhile
+        return await asyncio.to_thread(super().get_resource_status, vmid, node, vm_type)
     
     # VM Management - async wrappers
     async def start_resource(self, vmid: str, node: str) -> Dict[str, Any]:
@@ -105,7 +107,7 @@ class ProxmoxService(BaseProxmoxService):
     
     async def list_backups(self, node: str = "", storage: str = "") -> Dict[str, Any]:
         """List available backups."""
-        backups = self.backup_service.list_backups(node, storage)
+        backups = await self.backup_service.list_backups(node, storage)
         return {'backups': backups}
     
     async def restore_backup(self, archive: str, vmid: str, node: str,
@@ -113,6 +115,11 @@ class ProxmoxService(BaseProxmoxService):
         """Restore a VM/container from backup."""
         return self.backup_service.restore_backup(archive, vmid, node, storage, force)
     
+    async def get_tasks_status(self, upids: List[str]) -> Dict[str, Any]:
+        """Get the status of several backup/restore tasks in one call."""
+        tasks = await self.backup_service.get_tasks_status(upids)
+        return {'tasks': tasks}
+    
     # Template Management - async wrappers
     async def create_template(self, vmid: str, node: str) -> Dict[str, Any]:
         """Convert a VM to a template."""
@@ -141,7 +148,7 @@ class ProxmoxService(BaseProxmoxService):
     
     async def get_snapshots(self, vmid: str, node: str) -> Dict[str, Any]:
         """List all snapshots for a VM."""
-        snapshots = self.snapshot_service.get_snapshots(vmid, node)
+        snapshots = await asyncio.to_thread(self.snapshot_service.get_snapshots, vmid, node)
         return {'snapshots': snapshots}
     
     # User Management - async wrappers
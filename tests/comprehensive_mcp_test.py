@@ -231,8 +231,9 @@ class ProxmoxMCPTester:
                 }
                 print(f"       Result: ❌ ERROR - {e}")
             
-            # Small delay between tests
-            await asyncio.sleep(0.5)
+            # Small delay between tests that actually hit the cluster
+            if not self.test_results[tool_name]['message'].startswith('Skipped'):
+                await asyncio.sleep(0.5)
         
         await self.cleanup_test_resources()
         self.print_final_report()
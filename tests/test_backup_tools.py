@@ -0,0 +1,54 @@
+"""
+Output checks for the backup/restore MCP tools against a canned service.
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+pytest.importorskip("mcp")
+import mcp_server  # noqa: E402
+
+UPID = "UPID:pve1:0000ABCD:00112233:65000000:vzdump:100:root@pam:"
+
+
+class FakeService:
+    """Returns what BackupService returns once Proxmox accepts the task."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create_backup(self, vmid, node, **kwargs):
+        self.calls.append(("create_backup", vmid, node, kwargs))
+        return {"status": "success", "message": f"Backup of {vmid} initiated", "task": UPID}
+
+    async def restore_backup(self, archive, vmid, node, storage=None, force=False):
+        self.calls.append(("restore_backup", archive, vmid, node, storage, force))
+        return {"status": "success", "message": f"Restore of {vmid} from {archive} initiated", "task": UPID}
+
+
+@pytest.fixture
+def fake_service(monkeypatch):
+    fake = FakeService()
+    monkeypatch.setattr(mcp_server, "service", fake)
+    return fake
+
+
+def test_create_backup_reports_task_id(fake_service):
+    output = asyncio.run(mcp_server.create_backup("100", "pve1", mode="stop", compress="lzo"))
+
+    assert not output.startswith("❌")
+    assert f"Task ID: {UPID}" in output
+    # mode and compress reach the service under their own names
+    assert fake_service.calls[0][3]["mode"] == "stop"
+    assert fake_service.calls[0][3]["compress"] == "lzo"
+
+
+def test_restore_backup_reports_task_id(fake_service):
+    output = asyncio.run(mcp_server.restore_backup("local:backup/vzdump-qemu-100.vma.zst", "101", "pve1"))
+
+    assert not output.startswith("❌")
+    assert f"Task ID: {UPID}" in output